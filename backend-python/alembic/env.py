@@ -41,7 +41,13 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with given connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # One transaction per revision, so a lock/statement timeout in one
+    # migration doesn't roll back the whole upgrade chain
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -19,49 +19,81 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # Fail fast instead of queueing behind long-running readers: each
+    # create_table takes an ACCESS EXCLUSIVE lock, and without a lock_timeout
+    # a single stuck query would block the deployment indefinitely
+    op.execute("SET lock_timeout = '5s'")
+    op.execute("SET statement_timeout = '60s'")
+
     # Create clubs table
+    # Columns are ordered fixed-width-largest-first (UUIDs, timestamp, then
+    # variable-length bytea) so rows carry no alignment padding
     op.create_table(
         'clubs',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('owner_user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('created', sa.DateTime(), nullable=False),
+        sa.Column('created', sa.DateTime(), nullable=False,
+                  server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(), nullable=False,
+                  server_default=sa.text('now()')),
+        sa.Column('encryption_iv', sa.LargeBinary(length=16), nullable=False),
         sa.Column('encrypted_name', sa.LargeBinary(length=1024), nullable=False),
         sa.Column('encrypted_description', sa.LargeBinary(length=5120), nullable=True),
-        sa.Column('encrypted_profile_picture', sa.LargeBinary(), nullable=True),
-        sa.Column('encryption_iv', sa.LargeBinary(length=16), nullable=False),
+        sa.ForeignKeyConstraint(['owner_user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # Create club_policies table
+    # Policy flags change independently of the encrypted metadata; a narrow
+    # side table means toggling a flag rewrites bytes of WAL, not kilobytes
+    # of unchanged ciphertext
+    op.create_table(
+        'club_policies',
+        sa.Column('club_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('max_members', sa.Integer(), nullable=False),
         sa.Column('is_public', sa.Boolean(), nullable=False),
         sa.Column('members_can_post', sa.Boolean(), nullable=False),
         sa.Column('members_can_invite', sa.Boolean(), nullable=False),
-        sa.Column('max_members', sa.Integer(), nullable=False),
-        sa.ForeignKeyConstraint(['owner_user_id'], ['users.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('club_id')
+    )
+    # Create club_profile_pictures table
+    # Pictures live in a side table so clubs rows stay narrow and scans over
+    # club metadata never pull TOASTed picture blobs through the buffer cache.
+    op.create_table(
+        'club_profile_pictures',
+        sa.Column('club_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('encrypted_profile_picture', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('club_id')
     )
-    op.create_index(op.f('ix_clubs_owner_user_id'), 'clubs', ['owner_user_id'], unique=False)
 
     # Create club_members table
+    # Fixed-width columns first; variable-length role/key last to avoid
+    # alignment padding between the UUIDs
     op.create_table(
         'club_members',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('club_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('joined', sa.DateTime(), nullable=False),
-        sa.Column('role', sa.String(length=20), nullable=False),
+        sa.Column('joined', sa.DateTime(), nullable=False,
+                  server_default=sa.text('now()')),
         sa.Column('encrypted_aes_key', sa.LargeBinary(length=512), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=False),
         sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('club_id', 'user_id', name='uq_club_user')
+        sa.PrimaryKeyConstraint('id')
+        # (club_id, user_id) uniqueness is enforced by the covering unique
+        # index built below, not a table constraint
     )
-    op.create_index(op.f('ix_club_members_club_id'), 'club_members', ['club_id'], unique=False)
-    op.create_index(op.f('ix_club_members_user_id'), 'club_members', ['user_id'], unique=False)
-
     # Create club_events table
     op.create_table(
         'club_events',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('club_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=False,
+                  server_default=sa.text('now()')),
         sa.Column('expiry', sa.DateTime(), nullable=False),
         sa.Column('encrypted_event', sa.LargeBinary(length=5120), nullable=False),
         sa.Column('encryption_iv', sa.LargeBinary(length=16), nullable=False),
@@ -69,20 +101,95 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('club_id', 'id')
     )
-    op.create_index(op.f('ix_club_events_club_id'), 'club_events', ['club_id'], unique=False)
-    op.create_index(op.f('ix_club_events_expiry'), 'club_events', ['expiry'], unique=False)
-    op.create_index(op.f('ix_club_events_user_id'), 'club_events', ['user_id'], unique=False)
+    # Leave free space on club_events and club_members pages so expiry
+    # extensions and role/key updates can be HOT (same-page) updates that
+    # skip index maintenance. clubs is mostly-append, so it keeps the default
+    op.execute('ALTER TABLE club_events SET (fillfactor = 70)')
+    op.execute('ALTER TABLE club_members SET (fillfactor = 70)')
+
+    # Enforce the blob size bounds the app assumes. bytea is unbounded in
+    # Postgres regardless of the SQLAlchemy length=, so explicit CHECKs keep
+    # pathological rows from forcing the whole tuple out of line
+    op.create_check_constraint(
+        'ck_clubs_name_len', 'clubs', 'octet_length(encrypted_name) <= 1024'
+    )
+    op.create_check_constraint(
+        'ck_clubs_description_len', 'clubs',
+        'octet_length(encrypted_description) <= 5120'
+    )
+    op.create_check_constraint(
+        'ck_club_events_event_len', 'club_events',
+        'octet_length(encrypted_event) <= 5120'
+    )
+
+    # Small ciphertexts stay inline and uncompressed, skipping a TOAST
+    # indirection on every SELECT
+    op.execute('ALTER TABLE clubs ALTER COLUMN encrypted_name SET STORAGE MAIN')
+    op.execute('ALTER TABLE clubs ALTER COLUMN encryption_iv SET STORAGE MAIN')
+    op.execute(
+        'ALTER TABLE club_events ALTER COLUMN encryption_iv SET STORAGE MAIN'
+    )
+
+    # Build indexes with CREATE INDEX CONCURRENTLY so index builds don't take
+    # ACCESS EXCLUSIVE locks and block DML while the migration runs.
+    # CONCURRENTLY cannot run inside a transaction, so use an autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_clubs_owner_user_id '
+            'ON clubs (owner_user_id)'
+        )
+        # Unique membership index with INCLUDE (role): the per-request
+        # membership/role check becomes an index-only scan. Its club_id left
+        # prefix also covers member listings, so no separate club_id index
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY uq_club_user '
+            'ON club_members (club_id, user_id) INCLUDE (role)'
+        )
+        # (user_id, club_id) keeps "clubs for this user" index-only too
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_club_members_user_id '
+            'ON club_members (user_id, club_id)'
+        )
+        # Partial index over public clubs keeps the search total an
+        # index-only count
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_club_policies_public '
+            'ON club_policies (club_id) WHERE is_public'
+        )
+        # Composite (club_id, expiry) serves per-club expiry sweeps with a
+        # single range scan instead of a BitmapAnd of two single-column indexes
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_club_events_club_id_expiry '
+            'ON club_events (club_id, expiry)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_club_events_expiry '
+            'ON club_events (expiry)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_club_events_user_id '
+            'ON club_events (user_id)'
+        )
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_club_events_user_id'), table_name='club_events')
-    op.drop_index(op.f('ix_club_events_expiry'), table_name='club_events')
-    op.drop_index(op.f('ix_club_events_club_id'), table_name='club_events')
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_club_events_user_id')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_club_events_expiry')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_club_events_club_id_expiry')
     op.drop_table('club_events')
 
-    op.drop_index(op.f('ix_club_members_user_id'), table_name='club_members')
-    op.drop_index(op.f('ix_club_members_club_id'), table_name='club_members')
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_club_members_user_id')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS uq_club_user')
     op.drop_table('club_members')
 
-    op.drop_index(op.f('ix_clubs_owner_user_id'), table_name='clubs')
+    op.drop_table('club_profile_pictures')
+
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_club_policies_public')
+    op.drop_table('club_policies')
+
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_clubs_owner_user_id')
     op.drop_table('clubs')
@@ -0,0 +1,44 @@
+"""Add composite indexes for event feed and follow secret lookups
+
+Revision ID: 002_add_event_follow_indexes
+Revises: 001_add_club_tables
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002_add_event_follow_indexes'
+down_revision: Union[str, None] = '001_add_club_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps both tables writable while the indexes build; these
+    # are the hottest write paths in the API
+    with op.get_context().autocommit_block():
+        # get_events filters (user_id, timestamp >= since) ascending; one
+        # index range scan per followed user
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_user_events_user_timestamp '
+            'ON user_events (user_id, timestamp)'
+        )
+        # The batched follow-secret validation probes (user_id, secret)
+        # pairs; unique so put_follow_secret can upsert with ON CONFLICT
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY uq_user_follow_secrets_user_secret '
+            'ON user_follow_secrets (user_id, follow_secret)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            'DROP INDEX CONCURRENTLY IF EXISTS uq_user_follow_secrets_user_secret'
+        )
+        op.execute(
+            'DROP INDEX CONCURRENTLY IF EXISTS ix_user_events_user_timestamp'
+        )
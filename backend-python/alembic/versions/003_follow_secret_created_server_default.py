@@ -0,0 +1,35 @@
+"""Fill user_follow_secrets.created with a server-side default
+
+Revision ID: 003_follow_secret_created_default
+Revises: 002_add_event_follow_indexes
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_follow_secret_created_default'
+down_revision: Union[str, None] = '002_add_event_follow_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Inserts stop shipping a client-side clock value; Postgres fills the
+    # column, matching the clubs/club_events timestamp columns
+    op.alter_column(
+        'user_follow_secrets',
+        'created',
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'user_follow_secrets',
+        'created',
+        server_default=None,
+    )
@@ -0,0 +1,34 @@
+"""Drop the single-column follow_secret index
+
+Revision ID: 004_drop_follow_secret_index
+Revises: 003_follow_secret_created_default
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_drop_follow_secret_index'
+down_revision: Union[str, None] = '003_follow_secret_created_default'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every follow-secret lookup probes (user_id, follow_secret), which the
+    # unique composite index serves; the single-column index only added
+    # write amplification on an insert-heavy table
+    with op.get_context().autocommit_block():
+        op.execute(
+            'DROP INDEX CONCURRENTLY IF EXISTS ix_user_follow_secrets_follow_secret'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_user_follow_secrets_follow_secret '
+            'ON user_follow_secrets (follow_secret)'
+        )
@@ -0,0 +1,38 @@
+"""Add server-side now() defaults to remaining timestamp columns
+
+Revision ID: 005_timestamp_server_defaults
+Revises: 004_drop_follow_secret_index
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_timestamp_server_defaults'
+down_revision: Union[str, None] = '004_drop_follow_secret_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    ('users', 'created'),
+    ('users', 'last_accessed'),
+    ('user_events', 'timestamp'),
+    ('user_events', 'last_accessed'),
+    ('user_inbox_items', 'created'),
+    ('shared_items', 'timestamp'),
+)
+
+
+def upgrade() -> None:
+    # Postgres fills these on insert now; matches the clubs/club_events and
+    # user_follow_secrets columns that already carry server defaults
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
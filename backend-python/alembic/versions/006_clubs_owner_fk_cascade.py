@@ -0,0 +1,42 @@
+"""Add ON DELETE CASCADE to clubs.owner_user_id
+
+Revision ID: 006_clubs_owner_fk_cascade
+Revises: 005_timestamp_server_defaults
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006_clubs_owner_fk_cascade'
+down_revision: Union[str, None] = '005_timestamp_server_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every other foreign key onto users.id already cascades at the
+    # database level; this was the one relationship still relying on the
+    # ORM loading owned clubs into memory to cascade the delete in Python.
+    op.drop_constraint('clubs_owner_user_id_fkey', 'clubs', type_='foreignkey')
+    op.create_foreign_key(
+        'clubs_owner_user_id_fkey',
+        'clubs',
+        'users',
+        ['owner_user_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('clubs_owner_user_id_fkey', 'clubs', type_='foreignkey')
+    op.create_foreign_key(
+        'clubs_owner_user_id_fkey',
+        'clubs',
+        'users',
+        ['owner_user_id'],
+        ['id'],
+    )
@@ -0,0 +1,112 @@
+"""Pack user_inbox_items.encrypted_message chunks into one bytea
+
+Revision ID: 007_pack_inbox_message_chunks
+Revises: 006_clubs_owner_fk_cascade
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007_pack_inbox_message_chunks'
+down_revision: Union[str, None] = '006_clubs_owner_fk_cascade'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Each chunk becomes a 4-byte big-endian length prefix (int4send)
+    # followed by the chunk bytes, matching pack_message_chunks() in
+    # app/models/database/user_inbox_item.py. Inbox items are transient
+    # (deleted on read), so the row-by-row rewrite stays small.
+    op.add_column(
+        'user_inbox_items',
+        sa.Column('encrypted_message_packed', sa.LargeBinary(), nullable=True),
+    )
+    op.add_column(
+        'user_inbox_items',
+        sa.Column('chunk_count', sa.Integer(), nullable=True),
+    )
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            r record;
+            packed bytea;
+            chunk bytea;
+        BEGIN
+            FOR r IN SELECT id, encrypted_message FROM user_inbox_items LOOP
+                packed := ''::bytea;
+                FOREACH chunk IN ARRAY r.encrypted_message LOOP
+                    packed := packed || int4send(octet_length(chunk)) || chunk;
+                END LOOP;
+                UPDATE user_inbox_items
+                SET encrypted_message_packed = packed,
+                    chunk_count = coalesce(array_length(r.encrypted_message, 1), 0)
+                WHERE id = r.id;
+            END LOOP;
+        END $$;
+        """
+    )
+    op.drop_column('user_inbox_items', 'encrypted_message')
+    op.alter_column(
+        'user_inbox_items',
+        'encrypted_message_packed',
+        new_column_name='encrypted_message',
+        nullable=False,
+    )
+    op.alter_column('user_inbox_items', 'chunk_count', nullable=False)
+
+
+def downgrade() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    op.add_column(
+        'user_inbox_items',
+        sa.Column(
+            'encrypted_message_chunks',
+            postgresql.ARRAY(sa.LargeBinary()),
+            nullable=True,
+        ),
+    )
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            r record;
+            chunks bytea[];
+            len integer;
+            off integer;
+        BEGIN
+            FOR r IN SELECT id, encrypted_message, chunk_count
+                     FROM user_inbox_items LOOP
+                chunks := ARRAY[]::bytea[];
+                off := 1;
+                FOR i IN 1..r.chunk_count LOOP
+                    len := (get_byte(r.encrypted_message, off - 1) << 24)
+                         | (get_byte(r.encrypted_message, off) << 16)
+                         | (get_byte(r.encrypted_message, off + 1) << 8)
+                         | get_byte(r.encrypted_message, off + 2);
+                    off := off + 4;
+                    chunks := chunks
+                        || substring(r.encrypted_message FROM off FOR len);
+                    off := off + len;
+                END LOOP;
+                UPDATE user_inbox_items
+                SET encrypted_message_chunks = chunks
+                WHERE id = r.id;
+            END LOOP;
+        END $$;
+        """
+    )
+    op.drop_column('user_inbox_items', 'encrypted_message')
+    op.drop_column('user_inbox_items', 'chunk_count')
+    op.alter_column(
+        'user_inbox_items',
+        'encrypted_message_chunks',
+        new_column_name='encrypted_message',
+        nullable=False,
+    )
@@ -0,0 +1,33 @@
+"""Add expiry index to shared_items for cleanup scans
+
+Revision ID: 008_shared_items_expiry_index
+Revises: 007_pack_inbox_message_chunks
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_shared_items_expiry_index'
+down_revision: Union[str, None] = '007_pack_inbox_message_chunks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the index builds; the
+    # batched expiry cleanup selects its delete batches through this index.
+    # The rate limit database is create_all-managed, so the matching
+    # rate_limit_consumptions timestamp index lives only in the model.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_shared_items_expiry '
+            'ON shared_items (expiry)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_shared_items_expiry')
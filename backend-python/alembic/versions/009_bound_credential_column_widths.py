@@ -0,0 +1,51 @@
+"""Bound users and follow-secret credential column widths
+
+Revision ID: 009_bound_credential_columns
+Revises: 008_shared_items_expiry_index
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009_bound_credential_columns'
+down_revision: Union[str, None] = '008_shared_items_expiry_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    # hashed_password is a PBKDF2-SHA512 64-byte key as hex: always 128
+    ('users', 'hashed_password', 128),
+    # user_lookup is a 12-char CUID; 24 covers any wider historical rows
+    ('users', 'user_lookup', 24),
+    # follow secrets are client-generated UUID strings; 40 matches the
+    # original backend's declared maximum
+    ('user_follow_secrets', 'follow_secret', 40),
+)
+
+
+def upgrade() -> None:
+    # text -> varchar(n) validates existing rows with a scan but does not
+    # rewrite the table
+    for table, column, width in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(width),
+            existing_type=sa.Text(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column, width in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            existing_type=sa.String(width),
+            existing_nullable=False,
+        )
@@ -0,0 +1,37 @@
+"""Add updated_at to club_events for ETag revalidation
+
+Revision ID: 010_club_event_updated_at
+Revises: 009_bound_credential_columns
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010_club_event_updated_at'
+down_revision: Union[str, None] = '009_bound_credential_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backfilled from timestamp: existing rows have never been re-posted
+    # with a replaced payload as far as the ETag is concerned
+    op.add_column(
+        'club_events',
+        sa.Column(
+            'updated_at',
+            sa.DateTime(),
+            nullable=True,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.execute('UPDATE club_events SET updated_at = timestamp')
+    op.alter_column('club_events', 'updated_at', nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column('club_events', 'updated_at')
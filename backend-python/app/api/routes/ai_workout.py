@@ -1,12 +1,18 @@
 """AI workout generation API routes."""
 
+import asyncio
+from datetime import timezone
+from email.utils import format_datetime
 from typing import Annotated
 from fastapi import APIRouter, Depends, Response, status
-from sqlmodel.ext.asyncio.session import AsyncSession
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from app.db.session import get_rate_limit_db
 from app.auth.purchase_token import PurchaseTokenDep
-from app.services.rate_limit import RateLimitService, get_rate_limit_service
+from app.services.rate_limit import (
+    RateLimitResult,
+    RateLimitService,
+    get_rate_limit_service,
+)
 from app.services.ai_workout_planner.gpt_planner import (
     GptAiWorkoutPlanner,
     get_gpt_ai_workout_planner,
@@ -22,12 +28,31 @@ from app.core.exceptions import RateLimitException
 router = APIRouter(prefix="/ai", tags=["ai"])
 
 
-@router.post("/workout", response_model=ProgramBlueprint)
+def _raise_if_rate_limited(result: RateLimitResult) -> None:
+    """Raise RateLimitException with an RFC 7231 Retry-After header if limited.
+
+    email.utils.format_datetime produces the HTTP-date format directly without
+    the locale-aware %a/%b lookups strftime re-parses on every call.
+    """
+    if not result.is_rate_limited:
+        return
+
+    retry_after = result.retry_after
+    if retry_after:
+        if retry_after.tzinfo is None:
+            retry_after = retry_after.replace(tzinfo=timezone.utc)
+        raise RateLimitException(
+            retry_after=format_datetime(retry_after, usegmt=True)
+        )
+    raise RateLimitException(retry_after="3600")  # Fallback: 1 hour
+
+
+@router.post("/workout", response_model=ProgramBlueprint, response_class=ORJSONResponse)
 async def generate_ai_workout(
     request: GenerateAiWorkoutPlanRequest,
     response: Response,
     auth: PurchaseTokenDep,
-    rate_limit_db: Annotated[AsyncSession, Depends(get_rate_limit_db)],
+    rate_limiter: Annotated[RateLimitService, Depends(get_rate_limit_service)],
     planner: Annotated[GptAiWorkoutPlanner, Depends(get_gpt_ai_workout_planner)],
 ) -> ProgramBlueprint:
     """
@@ -40,7 +65,7 @@ async def generate_ai_workout(
         request: Workout plan attributes
         response: FastAPI response for headers
         auth: Purchase token authentication
-        rate_limit_db: Rate limit database session
+        rate_limiter: Rate limit service
         planner: AI workout planner service
 
     Returns:
@@ -50,28 +75,65 @@ async def generate_ai_workout(
         RateLimitException: If rate limit exceeded
     """
     # Check rate limits
-    rate_limiter = await get_rate_limit_service(rate_limit_db)
     rate_limit_result = await rate_limiter.check_rate_limit(
         auth.app_store, auth.pro_token
     )
 
-    if rate_limit_result.is_rate_limited:
-        retry_after = rate_limit_result.retry_after
-        if retry_after:
-            raise RateLimitException(retry_after=retry_after.strftime("%a, %d %b %Y %H:%M:%S GMT"))
-        raise RateLimitException(retry_after="3600")  # Fallback: 1 hour
+    _raise_if_rate_limited(rate_limit_result)
 
     # Generate workout plan
     plan = await planner.generate_workout_plan(request.attributes)
     return plan
 
 
-@router.post("/session", response_model=SessionBlueprint)
+@router.post("/workout/stream")
+async def stream_ai_workout(
+    request: GenerateAiWorkoutPlanRequest,
+    auth: PurchaseTokenDep,
+    rate_limiter: Annotated[RateLimitService, Depends(get_rate_limit_service)],
+    planner: Annotated[GptAiWorkoutPlanner, Depends(get_gpt_ai_workout_planner)],
+) -> StreamingResponse:
+    """
+    Stream an AI-powered workout plan as newline-delimited JSON.
+
+    Emits one SessionBlueprint line as soon as GPT-4o finishes each session,
+    followed by a final line with the program-level metadata, so clients see
+    the first session without waiting for the whole program to generate.
+
+    Requires valid purchase token authentication.
+    Subject to rate limiting based on app store.
+
+    Args:
+        request: Workout plan attributes
+        auth: Purchase token authentication
+        rate_limiter: Rate limit service
+        planner: AI workout planner service
+
+    Returns:
+        StreamingResponse of NDJSON lines
+
+    Raises:
+        RateLimitException: If rate limit exceeded
+    """
+    # Check rate limits
+    rate_limit_result = await rate_limiter.check_rate_limit(
+        auth.app_store, auth.pro_token
+    )
+
+    _raise_if_rate_limited(rate_limit_result)
+
+    return StreamingResponse(
+        planner.stream_workout_plan(request.attributes),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/session", response_model=SessionBlueprint, response_class=ORJSONResponse)
 async def generate_ai_session(
     request: GenerateAiSessionRequest,
     response: Response,
     auth: PurchaseTokenDep,
-    rate_limit_db: Annotated[AsyncSession, Depends(get_rate_limit_db)],
+    rate_limiter: Annotated[RateLimitService, Depends(get_rate_limit_service)],
     planner: Annotated[GptAiWorkoutPlanner, Depends(get_gpt_ai_workout_planner)],
 ) -> SessionBlueprint:
     """
@@ -84,7 +146,7 @@ async def generate_ai_session(
         request: Session attributes
         response: FastAPI response for headers
         auth: Purchase token authentication
-        rate_limit_db: Rate limit database session
+        rate_limiter: Rate limit service
         planner: AI workout planner service
 
     Returns:
@@ -94,17 +156,64 @@ async def generate_ai_session(
         RateLimitException: If rate limit exceeded
     """
     # Check rate limits
-    rate_limiter = await get_rate_limit_service(rate_limit_db)
     rate_limit_result = await rate_limiter.check_rate_limit(
         auth.app_store, auth.pro_token
     )
 
-    if rate_limit_result.is_rate_limited:
-        retry_after = rate_limit_result.retry_after
-        if retry_after:
-            raise RateLimitException(retry_after=retry_after.strftime("%a, %d %b %Y %H:%M:%S GMT"))
-        raise RateLimitException(retry_after="3600")  # Fallback: 1 hour
+    _raise_if_rate_limited(rate_limit_result)
 
     # Generate session
     session = await planner.generate_session(request.attributes)
     return session
+
+
+@router.post(
+    "/sessions:batch",
+    response_model=list[SessionBlueprint],
+    response_class=ORJSONResponse,
+)
+async def generate_ai_sessions_batch(
+    requests: list[GenerateAiSessionRequest],
+    auth: PurchaseTokenDep,
+    rate_limiter: Annotated[RateLimitService, Depends(get_rate_limit_service)],
+    planner: Annotated[GptAiWorkoutPlanner, Depends(get_gpt_ai_workout_planner)],
+) -> list[SessionBlueprint]:
+    """
+    Generate several AI workout sessions in one request.
+
+    The whole batch is debited from the rate limit in a single round trip;
+    if only part of the batch fits in the remaining quota, that many
+    sessions are generated and returned. Generation runs concurrently with
+    bounded parallelism.
+
+    Args:
+        requests: Session attributes, one per session to generate
+        auth: Purchase token authentication
+        rate_limiter: Rate limit service
+        planner: AI workout planner service
+
+    Returns:
+        List of SessionBlueprints, at most one per request
+
+    Raises:
+        RateLimitException: If the quota is already exhausted
+    """
+    if not requests:
+        return []
+
+    # One rate limit round trip for the whole batch
+    rate_limit_result = await rate_limiter.check_rate_limit(
+        auth.app_store, auth.pro_token, count=len(requests)
+    )
+
+    _raise_if_rate_limited(rate_limit_result)
+
+    # Truncate to what the quota allowed and generate concurrently
+    granted = requests[: rate_limit_result.requests_granted]
+    semaphore = asyncio.Semaphore(4)
+
+    async def generate(req: GenerateAiSessionRequest) -> SessionBlueprint:
+        async with semaphore:
+            return await planner.generate_session(req.attributes)
+
+    return list(await asyncio.gather(*(generate(req) for req in granted)))
@@ -1,27 +1,42 @@
 """Event management API routes."""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import select
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import ColumnElement, func, update
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Mapped
+from sqlmodel import col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.session import get_db
 from app.services.password import PasswordService, get_password_service
-from app.auth.password import verify_user_password
-from app.models.database.user import User
+from app.auth.password import authenticate_user
 from app.models.database.user_event import UserEvent
-from app.models.database.user_follow_secret import UserFollowSecret
+from app.services.batch import batch_fetch_follow_secrets
 from app.models.schemas.event import (
     PutUserEventRequest,
     GetEventsRequest,
     GetEventsResponse,
     UserEventResponse,
 )
-from app.core.exceptions import NotFoundException, UnauthorizedException
 
 router = APIRouter(prefix="/event", tags=["events"])
 
+# Only the columns UserEventResponse carries, labelled with its field names;
+# fetching full entities would hydrate last_accessed and ORM bookkeeping for
+# rows that are serialized straight back out
+_EVENT_RESPONSE_COLS: tuple[ColumnElement[Any] | Mapped[Any], ...] = (
+    col(UserEvent.user_id),
+    col(UserEvent.id).label("event_id"),
+    col(UserEvent.timestamp),
+    col(UserEvent.encrypted_event).label("encrypted_event_payload"),
+    col(UserEvent.encryption_iv).label("encrypted_event_iv"),
+    col(UserEvent.expiry),
+)
+
 
 @router.put("", status_code=status.HTTP_200_OK)
 async def put_event(
@@ -45,42 +60,35 @@ async def put_event(
         UnauthorizedException: If password verification fails
     """
     # Get user and verify password
-    result = await db.execute(select(User).where(User.id == request.user_id))
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise NotFoundException("User not found")
-
-    verify_user_password(request.password, user, password_service)
-
-    # Check if event already exists
-    event_result = await db.execute(
-        select(UserEvent).where(
-            UserEvent.user_id == request.user_id,
-            UserEvent.id == request.event_id,
-        )
+    await authenticate_user(
+        request.user_id, request.password, db, password_service
     )
-    event = event_result.scalar_one_or_none()
-
-    if event:
-        # Update existing event
-        event.encrypted_event = request.encrypted_event_payload
-        event.encryption_iv = request.encrypted_event_iv
-        event.expiry = request.expiry
-        event.last_accessed = datetime.utcnow()
-    else:
-        # Create new event
-        event = UserEvent(
+
+    # Single UPSERT on the (user_id, id) primary key; the SELECT-then-branch
+    # version paid an extra round trip and raced concurrent PUTs of the same
+    # event. timestamp is left alone on conflict so it keeps marking
+    # creation; both clock columns are filled DB-side (server_default on
+    # insert, func.now() on conflict) so no client timestamp goes over the
+    # wire.
+    await db.execute(
+        pg_insert(UserEvent)
+        .values(
             id=request.event_id,
             user_id=request.user_id,
-            timestamp=datetime.utcnow(),
-            last_accessed=datetime.utcnow(),
             expiry=request.expiry,
             encrypted_event=request.encrypted_event_payload,
             encryption_iv=request.encrypted_event_iv,
         )
-        db.add(event)
-
+        .on_conflict_do_update(
+            index_elements=["user_id", "id"],
+            set_={
+                "encrypted_event": request.encrypted_event_payload,
+                "encryption_iv": request.encrypted_event_iv,
+                "expiry": request.expiry,
+                "last_accessed": func.now(),
+            },
+        )
+    )
     await db.commit()
     return {}
 
@@ -107,46 +115,60 @@ async def get_events(
         GetEventsResponse with events and invalid follow secrets
     """
     events: list[UserEventResponse] = []
-    invalid_follow_secrets: list[str] = []
 
+    # Validate every follow secret with one batched query instead of one
+    # SELECT per followed user
+    pairs = [(u.user_id, u.follow_secret) for u in request.users]
+    valid_pairs = await batch_fetch_follow_secrets(db, pairs)
+
+    invalid_follow_secrets = [
+        u.follow_secret
+        for u in request.users
+        if (u.user_id, u.follow_secret) not in valid_pairs
+    ]
+
+    # Per-user since cutoffs for the users that passed validation; the SQL
+    # filter uses the oldest cutoff and the per-user filtering happens in
+    # Python while bucketing, keeping the whole fetch one round trip
+    since_by_user: dict[UUID, datetime] = {}
     for user_request in request.users:
-        # Verify follow secret
-        secret_result = await db.execute(
-            select(UserFollowSecret).where(
-                UserFollowSecret.user_id == user_request.user_id,
-                UserFollowSecret.follow_secret == user_request.follow_secret,
+        if (user_request.user_id, user_request.follow_secret) not in valid_pairs:
+            continue
+        uid = user_request.user_id
+        if uid not in since_by_user or user_request.since < since_by_user[uid]:
+            since_by_user[uid] = user_request.since
+
+    if since_by_user:
+        min_since = min(since_by_user.values())
+        # Stream in server-side cursor chunks so a wide follow list doesn't
+        # materialize every encrypted payload before serialization starts
+        events_result = await db.stream(
+            sa_select(*_EVENT_RESPONSE_COLS)
+            .where(
+                col(UserEvent.user_id).in_(list(since_by_user)),
+                col(UserEvent.timestamp) >= min_since,
             )
+            .order_by(col(UserEvent.user_id), col(UserEvent.timestamp).asc()),
+            execution_options={"yield_per": 200},
         )
-        follow_secret = secret_result.scalar_one_or_none()
-
-        if not follow_secret:
-            # Invalid follow secret
-            invalid_follow_secrets.append(user_request.follow_secret)
-            continue
 
-        # Get events since timestamp
-        events_result = await db.execute(
-            select(UserEvent)
-            .where(UserEvent.user_id == user_request.user_id)
-            .where(UserEvent.timestamp >= user_request.since)
-            .order_by(UserEvent.timestamp.asc())
-        )
-        user_events = events_result.scalars().all()
-
-        # Update last_accessed for each event
-        for event in user_events:
-            event.last_accessed = datetime.utcnow()
-            events.append(
-                UserEventResponse(
-                    user_id=event.user_id,
-                    event_id=event.id,
-                    timestamp=event.timestamp,
-                    encrypted_event_payload=event.encrypted_event,
-                    encrypted_event_iv=event.encryption_iv,
-                    expiry=event.expiry,
-                )
+        # Trusted database rows skip per-item validation
+        async for row in events_result.mappings():
+            if row["timestamp"] < since_by_user[row["user_id"]]:
+                continue
+            events.append(UserEventResponse.model_construct(**row))
+
+        # One set-based UPDATE marks everything we just served, instead of
+        # dirtying each ORM instance and flushing an UPDATE per event
+        await db.execute(
+            update(UserEvent)
+            .where(
+                col(UserEvent.user_id).in_(list(since_by_user)),
+                col(UserEvent.timestamp) >= min_since,
             )
-
+            .values(last_accessed=func.now())
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
 
     return GetEventsResponse(
@@ -1,20 +1,18 @@
 """Follow secret management API routes."""
 
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from datetime import datetime
 
 from app.db.session import get_db
 from app.services.password import PasswordService, get_password_service
-from app.auth.password import verify_user_password
-from app.models.database.user import User
+from app.auth.password import authenticate_user
 from app.models.database.user_follow_secret import UserFollowSecret
 from app.models.schemas.follow import (
     PutUserFollowSecretRequest,
     DeleteUserFollowSecretRequest,
 )
-from app.core.exceptions import NotFoundException
 
 router = APIRouter(prefix="/follow-secret", tags=["social"])
 
@@ -41,32 +39,22 @@ async def put_follow_secret(
         UnauthorizedException: If password verification fails
     """
     # Get user and verify password
-    result = await db.execute(select(User).where(User.id == request.user_id))
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise NotFoundException("User not found")
-
-    verify_user_password(request.password, user, password_service)
-
-    # Check if follow secret already exists
-    secret_result = await db.execute(
-        select(UserFollowSecret).where(
-            UserFollowSecret.user_id == request.user_id,
-            UserFollowSecret.follow_secret == request.follow_secret,
-        )
+    await authenticate_user(
+        request.user_id, request.password, db, password_service
     )
-    existing_secret = secret_result.scalar_one_or_none()
 
-    if not existing_secret:
-        # Create new follow secret
-        follow_secret = UserFollowSecret(
+    # The unique (user_id, follow_secret) index lets this be a plain
+    # idempotent upsert - duplicates fall out at the index, no guard query.
+    # created is filled by the database's server_default.
+    await db.execute(
+        pg_insert(UserFollowSecret)
+        .values(
             user_id=request.user_id,
             follow_secret=request.follow_secret,
-            created=datetime.utcnow(),
         )
-        db.add(follow_secret)
-        await db.commit()
+        .on_conflict_do_nothing(index_elements=["user_id", "follow_secret"])
+    )
+    await db.commit()
 
     return {}
 
@@ -93,13 +81,9 @@ async def delete_follow_secret(
         UnauthorizedException: If password verification fails
     """
     # Get user and verify password
-    result = await db.execute(select(User).where(User.id == request.user_id))
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise NotFoundException("User not found")
-
-    verify_user_password(request.password, user, password_service)
+    await authenticate_user(
+        request.user_id, request.password, db, password_service
+    )
 
     # Find and delete follow secret
     secret_result = await db.execute(
@@ -1,12 +1,17 @@
 """Health check endpoint."""
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 
 router = APIRouter(tags=["health"])
 
+# Probes hit this every second or faster; a short public max-age lets
+# intermediaries absorb repeats without masking real outages
+_HEALTH_HEADERS = {"Cache-Control": "public, max-age=5"}
+
 
 @router.get("/health")
 @router.head("/health")
-async def health_check():
+async def health_check() -> PlainTextResponse:
     """Health check endpoint (GET and HEAD methods)."""
-    return "healthy"
+    return PlainTextResponse("healthy", headers=_HEALTH_HEADERS)
@@ -1,16 +1,19 @@
 """Inbox messaging API routes for encrypted messages."""
 
-from datetime import datetime
-from uuid import UUID
 from fastapi import APIRouter, Depends, status
-from sqlmodel import select
+from sqlalchemy import bindparam, delete, insert
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.session import get_db
 from app.services.password import PasswordService, get_password_service
-from app.auth.password import verify_user_password
+from app.auth.password import authenticate_user
 from app.models.database.user import User
-from app.models.database.user_inbox_item import UserInboxItem
+from app.models.database.user_inbox_item import (
+    UserInboxItem,
+    pack_message_chunks,
+    unpack_message_chunks,
+)
 from app.models.schemas.inbox import (
     PutInboxMessageRequest,
     GetInboxMessagesRequest,
@@ -21,6 +24,18 @@ from app.core.exceptions import NotFoundException
 
 router = APIRouter(prefix="/inbox", tags=["social"])
 
+# Built once at import time; executed with a bound parameter per request
+_CLEAR_INBOX_STMT = (
+    delete(UserInboxItem)
+    .where(col(UserInboxItem.user_id) == bindparam("inbox_user_id"))
+    .returning(
+        col(UserInboxItem.id),
+        col(UserInboxItem.encrypted_message),
+        col(UserInboxItem.chunk_count),
+        col(UserInboxItem.created),
+    )
+)
+
 
 @router.put("", status_code=status.HTTP_200_OK)
 async def put_inbox_message(
@@ -49,13 +64,17 @@ async def put_inbox_message(
     if user is None:
         raise NotFoundException("Recipient user not found")
 
-    # Create inbox item
-    inbox_item = UserInboxItem(
-        user_id=request.to_user_id,
-        encrypted_message=request.encrypted_message,
-        created=datetime.utcnow(),
+    # Core insert - no ORM instance for a row the handler never reads back;
+    # created is filled by the database's server default. Chunks are packed
+    # into a single blob so the row stores one bytea instead of a bytea
+    # array (see UserInboxItem).
+    await db.execute(
+        insert(UserInboxItem).values(
+            user_id=request.to_user_id,
+            encrypted_message=pack_message_chunks(request.encrypted_message),
+            chunk_count=len(request.encrypted_message),
+        )
     )
-    db.add(inbox_item)
     await db.commit()
 
     return {}
@@ -83,35 +102,30 @@ async def get_inbox_messages(
         UnauthorizedException: If password verification fails
     """
     # Get user and verify password
-    result = await db.execute(select(User).where(User.id == request.user_id))
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise NotFoundException("User not found")
-
-    verify_user_password(request.password, user, password_service)
+    await authenticate_user(
+        request.user_id, request.password, db, password_service
+    )
 
-    # Get all inbox messages
-    messages_result = await db.execute(
-        select(UserInboxItem)
-        .where(UserInboxItem.user_id == request.user_id)
-        .order_by(UserInboxItem.created.asc())
+    # Fetch and clear the inbox atomically with one DELETE ... RETURNING;
+    # SELECT-then-delete-per-row cost a round trip per message and could
+    # drop a message PUT between the select and the deletes
+    result = await db.execute(
+        _CLEAR_INBOX_STMT, {"inbox_user_id": request.user_id}
     )
-    messages = messages_result.scalars().all()
+    rows = sorted(result.all(), key=lambda row: row.created)
 
-    # Convert to response format
+    # Trusted database rows skip per-item validation; the packed blob is
+    # split back into the chunk list the wire format has always carried
     inbox_messages = [
-        GetInboxMessageResponse(
-            id=message.id,
-            encrypted_message=message.encrypted_message,
+        GetInboxMessageResponse.model_construct(
+            id=row.id,
+            encrypted_message=unpack_message_chunks(
+                row.encrypted_message, row.chunk_count
+            ),
         )
-        for message in messages
+        for row in rows
     ]
 
-    # Delete messages after retrieval (clear inbox)
-    for message in messages:
-        await db.delete(message)
-
     await db.commit()
 
     return GetInboxMessagesResponse(inbox_messages=inbox_messages)
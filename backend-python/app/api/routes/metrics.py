@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter
 
+from app.db.session import rate_limit_engine, user_data_engine
 from app.middleware.metrics import get_metrics_collector
 
 router = APIRouter()
@@ -17,11 +18,18 @@ async def get_metrics() -> dict:
     - Per-endpoint metrics (count, errors, duration)
     - Status code distribution
     - Error count
+    - Connection pool status per engine (spot exhaustion before it
+      manifests as pool-checkout timeouts under load)
 
     Note: This is a simple in-memory metrics collector.
     For production, consider using Prometheus, Cloud Monitoring, or similar.
     """
-    return get_metrics_collector().get_metrics()
+    metrics = get_metrics_collector().get_metrics()
+    metrics["db_pools"] = {
+        "user_data": user_data_engine.pool.status(),
+        "rate_limit": rate_limit_engine.pool.status(),
+    }
+    return metrics
 
 
 @router.get("/metrics/summary")
@@ -31,28 +39,24 @@ async def get_metrics_summary() -> dict:
 
     Returns a simplified view of key performance indicators.
     """
-    metrics = get_metrics_collector().get_metrics()
+    collector = get_metrics_collector()
+    metrics = collector.get_metrics()
 
     # Calculate error rate
     total_requests = metrics["total_requests"]
     total_errors = metrics["total_errors"]
     error_rate = (total_errors / total_requests * 100) if total_requests > 0 else 0
 
-    # Find slowest endpoint
-    slowest_endpoint = None
-    slowest_duration = 0
-    for endpoint, data in metrics["endpoints"].items():
-        if data["avg_duration_ms"] > slowest_duration:
-            slowest_duration = data["avg_duration_ms"]
-            slowest_endpoint = endpoint
+    # The collector maintains the slowest endpoint incrementally
+    slowest = collector.get_slowest_endpoint()
 
     return {
         "total_requests": total_requests,
         "total_errors": total_errors,
         "error_rate_percent": round(error_rate, 2),
         "slowest_endpoint": {
-            "endpoint": slowest_endpoint,
-            "avg_duration_ms": slowest_duration,
-        } if slowest_endpoint else None,
+            "endpoint": slowest[0],
+            "avg_duration_ms": slowest[1],
+        } if slowest else None,
         "status_codes": metrics["status_codes"],
     }
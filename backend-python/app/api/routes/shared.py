@@ -1,15 +1,16 @@
 """Shared item API routes for public sharing."""
 
+import hashlib
 from datetime import datetime
-from cuid2 import cuid_wrapper
-from fastapi import APIRouter, Depends, status
+from cuid2 import Cuid
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy import bindparam, insert
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.session import get_db
 from app.services.password import PasswordService, get_password_service
-from app.auth.password import verify_user_password
-from app.models.database.user import User
+from app.auth.password import authenticate_user
 from app.models.database.shared_item import SharedItem
 from app.models.schemas.shared import (
     PostSharedItemRequest,
@@ -19,6 +20,15 @@ from app.core.exceptions import NotFoundException
 
 router = APIRouter(prefix="/shareditem", tags=["sharing"])
 
+# Built once; 12-char ids match what the original backend generated
+_SHARED_ITEM_ID_GENERATOR = Cuid(length=12)
+
+# Built once at import time; executed with bound parameters per request
+_SHARED_ITEM_STMT = select(SharedItem).where(
+    SharedItem.id == bindparam("item_id"),
+    SharedItem.expiry >= bindparam("now"),
+)
+
 
 @router.post("", response_model=GetSharedItemResponse, status_code=status.HTTP_200_OK)
 async def create_shared_item(
@@ -43,49 +53,53 @@ async def create_shared_item(
         UnauthorizedException: If password verification fails
     """
     # Get user and verify password
-    result = await db.execute(select(User).where(User.id == request.user_id))
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise NotFoundException("User not found")
-
-    verify_user_password(request.password, user, password_service)
+    await authenticate_user(
+        request.user_id, request.password, db, password_service
+    )
 
     # Generate CUID for shared item
-    item_id = cuid_wrapper()
+    item_id = _SHARED_ITEM_ID_GENERATOR.generate()
+    timestamp = datetime.utcnow()
+
+    # Core insert - no ORM instance or unit-of-work tracking for a row the
+    # handler never reads back; the response is built from the values just
+    # inserted, so no post-commit refresh SELECT is needed either
+    await db.execute(
+        insert(SharedItem).values(
+            id=item_id,
+            user_id=request.user_id,
+            timestamp=timestamp,
+            expiry=request.expiry,
+            encrypted_payload=request.encrypted_payload,
+            encryption_iv=request.encryption_iv,
+        )
+    )
+    await db.commit()
 
-    # Create shared item
-    shared_item = SharedItem(
+    return GetSharedItemResponse(
         id=item_id,
         user_id=request.user_id,
-        timestamp=datetime.utcnow(),
-        expiry=request.expiry,
+        timestamp=timestamp,
         encrypted_payload=request.encrypted_payload,
         encryption_iv=request.encryption_iv,
-    )
-    db.add(shared_item)
-    await db.commit()
-    await db.refresh(shared_item)
-
-    return GetSharedItemResponse(
-        id=shared_item.id,
-        user_id=shared_item.user_id,
-        timestamp=shared_item.timestamp,
-        encrypted_payload=shared_item.encrypted_payload,
-        encryption_iv=shared_item.encryption_iv,
-        expiry=shared_item.expiry,
+        expiry=request.expiry,
     )
 
 
 @router.get("/{id}", response_model=GetSharedItemResponse)
 async def get_shared_item(
     id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-) -> GetSharedItemResponse:
+) -> GetSharedItemResponse | Response:
     """
     Get a publicly shared workout item.
 
-    No authentication required - public sharing endpoint.
+    No authentication required - public sharing endpoint. The payload is
+    immutable until expiry, so responses carry an ETag and a Cache-Control
+    max-age running out at the expiry time; shares posted publicly get
+    re-served by intermediaries instead of this handler.
 
     Args:
         id: CUID of the shared item
@@ -96,15 +110,27 @@ async def get_shared_item(
     Raises:
         NotFoundException: If shared item not found or expired
     """
-    result = await db.execute(select(SharedItem).where(SharedItem.id == id))
+    # Expiry is part of the SELECT predicate, so expired links (common for
+    # shares posted publicly) cost the same single round trip as missing ones
+    result = await db.execute(
+        _SHARED_ITEM_STMT, {"item_id": id, "now": datetime.utcnow()}
+    )
     shared_item = result.scalar_one_or_none()
 
     if shared_item is None:
         raise NotFoundException("Shared item not found")
 
-    # Check if expired
-    if shared_item.expiry < datetime.utcnow():
-        raise NotFoundException("Shared item has expired")
+    etag = (
+        f'"{hashlib.blake2b(shared_item.encrypted_payload, digest_size=8).hexdigest()}"'
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    max_age = max(
+        0, int((shared_item.expiry - datetime.utcnow()).total_seconds())
+    )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
 
     return GetSharedItemResponse(
         id=shared_item.id,
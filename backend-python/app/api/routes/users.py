@@ -1,13 +1,20 @@
 """User management API routes."""
 
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import select
+from typing import Any
+from fastapi import APIRouter, BackgroundTasks, Depends, status
+from sqlalchemy import ColumnElement, bindparam, or_, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm import Mapped
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from cuid2 import cuid_wrapper
+from cuid2 import Cuid
 
+from app.auth.password import verify_user_password
 from app.db.session import get_db
 from app.services.password import PasswordService, get_password_service
+from app.services.user_loader import user_loader
 from app.models.database.user import User
 from app.models.schemas.user import (
     CreateUserRequest,
@@ -18,11 +25,14 @@ from app.models.schemas.user import (
     GetUsersRequest,
     GetUsersResponse,
 )
-from app.core.exceptions import NotFoundException, UnauthorizedException
-from datetime import datetime
+from app.core.exceptions import NotFoundException
+from datetime import datetime, timedelta
 
 router = APIRouter(prefix="/user", tags=["users"])
 
+# Built once; 12-char lookups match what the original backend generated
+_USER_LOOKUP_GENERATOR = Cuid(length=12)
+
 
 @router.post("/create", response_model=CreateUserResponse, status_code=status.HTTP_200_OK)
 async def create_user(
@@ -43,41 +53,104 @@ async def create_user(
     hashed_password, salt = password_service.hash_password(password)
 
     # Generate 12-character CUID for user lookup
-    user_lookup = cuid_wrapper()
+    user_lookup = _USER_LOOKUP_GENERATOR.generate()
 
-    # Create user instance
+    # Create user instance; the id comes from the model's uuid7 default so
+    # new rows stay index-local, and created/last_accessed are filled by
+    # the database's server defaults
     user = User(
-        id=uuid.uuid4(),
         user_lookup=user_lookup,
         hashed_password=hashed_password,
         salt=salt,
-        last_accessed=datetime.utcnow(),
-        created=datetime.utcnow(),
         encryption_iv=b"",  # Empty initially, set by client
         rsa_public_key=b"",  # Empty initially, set by client
     )
 
-    # Save to database
+    # Save to database; every response field is already known client-side,
+    # so no post-commit refresh SELECT is needed
     db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     return CreateUserResponse(
         id=user.id,
-        lookup=user.user_lookup,
+        lookup=user_lookup,
         password=password,
     )
 
 
+# Only the columns GetUserResponse carries, labelled with its field names;
+# fetching full User entities would drag credential columns and identity-map
+# bookkeeping along for rows that are serialized straight back out
+_USER_RESPONSE_COLS: tuple[ColumnElement[Any] | Mapped[Any], ...] = (
+    col(User.id),
+    col(User.user_lookup).label("lookup"),
+    col(User.encrypted_current_plan),
+    col(User.encrypted_profile_picture),
+    col(User.encrypted_name),
+    col(User.encryption_iv),
+    col(User.rsa_public_key),
+)
+
+
+# Profile reads only refresh last_accessed once it is at least this stale,
+# so a hot profile doesn't take a row lock on every GET
+_TOUCH_INTERVAL_SECONDS = 60
+
+# Statements below are built once at import time and executed with bound
+# parameters, keeping the per-request compilation cost at a cache lookup
+_USER_BY_ID_OR_LOOKUP_STMT = sa_select(*_USER_RESPONSE_COLS).where(
+    or_(
+        col(User.id) == bindparam("user_id"),
+        col(User.user_lookup) == bindparam("lookup_value"),
+    )
+)
+_USER_BY_LOOKUP_STMT = sa_select(*_USER_RESPONSE_COLS).where(
+    col(User.user_lookup) == bindparam("lookup_value")
+)
+_TOUCH_USER_STMT = (
+    update(User)
+    .where(
+        col(User.id) == bindparam("touch_user_id"),
+        col(User.last_accessed) < bindparam("cutoff"),
+    )
+    .values(last_accessed=bindparam("now"))
+    .execution_options(synchronize_session=False)
+)
+
+
+async def _touch_user(user_id: uuid.UUID, bind: AsyncEngine) -> None:
+    """
+    Refresh a user's last_accessed timestamp outside the request path.
+
+    The session is opened on the engine of the request that scheduled the
+    touch (the request-scoped session itself is already closed by the time
+    background tasks run), so get_db overrides carry through.
+    """
+    now = datetime.utcnow()
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        await session.execute(
+            _TOUCH_USER_STMT,
+            {
+                "touch_user_id": user_id,
+                "cutoff": now - timedelta(seconds=_TOUCH_INTERVAL_SECONDS),
+                "now": now,
+            },
+        )
+        await session.commit()
+
+
 @router.get("/{id_or_lookup}", response_model=GetUserResponse)
 async def get_user(
     id_or_lookup: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> GetUserResponse:
     """
     Get user by ID (UUID) or lookup string.
 
-    Updates the user's last_accessed timestamp.
+    The last_accessed refresh happens after the response is sent, and only
+    when the stored value is stale, keeping this hot endpoint read-only on
+    the request path.
 
     Args:
         id_or_lookup: Either UUID string or user lookup string
@@ -88,28 +161,29 @@ async def get_user(
     Raises:
         NotFoundException: If user not found
     """
-    user: User | None = None
-
-    # Try parsing as UUID first
+    # One query covers both identifier shapes; a lookup string that fails
+    # to parse as a UUID can only ever match user_lookup
     try:
-        user_id = uuid.UUID(id_or_lookup)
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        stmt = _USER_BY_ID_OR_LOOKUP_STMT
+        params: dict = {
+            "user_id": uuid.UUID(id_or_lookup),
+            "lookup_value": id_or_lookup,
+        }
     except ValueError:
-        # Not a UUID, try as lookup string
-        result = await db.execute(select(User).where(User.user_lookup == id_or_lookup))
-        user = result.scalar_one_or_none()
+        stmt = _USER_BY_LOOKUP_STMT
+        params = {"lookup_value": id_or_lookup}
 
-    if user is None:
+    result = await db.execute(stmt, params)
+    row = result.mappings().first()
+
+    if row is None:
         raise NotFoundException("User not found")
 
-    # Update last_accessed timestamp
-    user.last_accessed = datetime.utcnow()
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    touch_bind = db.bind
+    assert isinstance(touch_bind, AsyncEngine)
+    background_tasks.add_task(_touch_user, row["id"], touch_bind)
 
-    return GetUserResponse.model_validate(user)
+    return GetUserResponse.model_construct(**row)
 
 
 @router.put("", status_code=status.HTTP_200_OK)
@@ -137,9 +211,9 @@ async def put_user(
     if user is None:
         raise NotFoundException("User not found")
 
-    # Verify password
-    if not password_service.verify_password(request.password, user.hashed_password, user.salt):
-        raise UnauthorizedException("Invalid password")
+    # Verify password; the KDF runs on the shared thread pool rather than
+    # blocking the event loop inside the handler
+    await verify_user_password(request.password, user, password_service)
 
     # Update encrypted fields
     user.encrypted_current_plan = request.encrypted_current_plan
@@ -150,6 +224,7 @@ async def put_user(
 
     db.add(user)
     await db.commit()
+    user_loader.invalidate(user.id)
 
     return {}
 
@@ -181,13 +256,13 @@ async def delete_user(
     if user is None:
         raise NotFoundException("User not found")
 
-    # Verify password
-    if not password_service.verify_password(request.password, user.hashed_password, user.salt):
-        raise UnauthorizedException("Invalid password")
+    # Verify password off the event loop, same as put_user
+    await verify_user_password(request.password, user, password_service)
 
     # Delete user (cascade deletes all related data)
     await db.delete(user)
     await db.commit()
+    user_loader.invalidate(user.id)
 
     return {}
 
@@ -210,10 +285,19 @@ async def get_users(
     Returns:
         GetUsersResponse with dict mapping user IDs to user data
     """
-    result = await db.execute(select(User).where(User.id.in_(request.ids)))
-    users = result.scalars().all()
+    # Stream in server-side cursor chunks instead of materializing all 200
+    # rows (each potentially carrying a 2MB profile-picture blob) at once;
+    # the id-list cap itself is enforced by the request schema before any
+    # database work happens
+    result = await db.stream(
+        sa_select(*_USER_RESPONSE_COLS).where(col(User.id).in_(request.ids)),
+        execution_options={"yield_per": 50},
+    )
 
-    # Convert to dict mapping ID -> GetUserResponse
-    users_dict = {user.id: GetUserResponse.model_validate(user) for user in users}
+    # Rows straight from the database are trusted, so model_construct skips
+    # per-item validation - noticeable at the 200-id batch limit
+    users_dict: dict[uuid.UUID, GetUserResponse] = {}
+    async for row in result.mappings():
+        users_dict[row["id"]] = GetUserResponse.model_construct(**row)
 
     return GetUsersResponse(users=users_dict)
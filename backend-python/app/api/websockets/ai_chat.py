@@ -1,13 +1,14 @@
 """WebSocket endpoint for real-time AI workout chat."""
 
-import json
+import asyncio
 import logging
 from uuid import uuid4
-from typing import Annotated
+from typing import Annotated, Any
 from fastapi import WebSocket, WebSocketDisconnect, Depends
-from sqlmodel.ext.asyncio.session import AsyncSession
+from pydantic import BaseModel, ValidationError
+import orjson
 
-from app.db.session import get_rate_limit_db
+from app.auth.session_token import issue_session_token, verify_session_token
 from app.core.enums import AppStore
 from app.services.purchase_verification.facade import (
     PurchaseVerificationService,
@@ -21,6 +22,24 @@ from app.services.ai_workout_planner.gpt_chat_planner import (
 
 logger = logging.getLogger(__name__)
 
+# Streamed tokens are coalesced until either bound is hit, so each WebSocket
+# frame carries a useful payload instead of one token per syscall. 20ms is
+# well under perceptible typing latency.
+_SEND_BUFFER_BYTES = 256
+_SEND_BUFFER_SECONDS = 0.02
+
+
+class WsMessage(BaseModel):
+    """SignalR-compatible message envelope."""
+
+    method: str
+    arguments: list[Any] = []
+
+
+async def _send_json(websocket: WebSocket, payload: dict[str, Any]) -> None:
+    """Send a JSON frame serialized with orjson instead of stdlib json."""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
 
 async def ai_chat_websocket(
     websocket: WebSocket,
@@ -28,7 +47,7 @@ async def ai_chat_websocket(
     verification_service: Annotated[
         PurchaseVerificationService, Depends(get_purchase_verification_service)
     ],
-    rate_limit_db: Annotated[AsyncSession, Depends(get_rate_limit_db)],
+    rate_limiter: Annotated[RateLimitService, Depends(get_rate_limit_service)],
 ):
     """
     WebSocket endpoint for real-time AI workout chat.
@@ -49,21 +68,27 @@ async def ai_chat_websocket(
     app_store = None
     pro_token = None
 
-    logger.info(f"WebSocket connection established: {connection_id}")
+    logger.info("WebSocket connection established: %s", connection_id)
 
     try:
         while True:
-            # Receive message from client
+            # Receive message from client; parsing and envelope validation
+            # happen in one Rust-level pass rather than json.loads plus
+            # ad-hoc dict lookups per frame
             data = await websocket.receive_text()
-            message = json.loads(data)
+            try:
+                message = WsMessage.model_validate_json(data)
+            except ValidationError:
+                await _send_json(websocket, {"error": "Invalid message envelope"})
+                continue
 
-            method = message.get("method")
-            args = message.get("arguments", [])
+            method = message.method
+            args = message.arguments
 
             if method == "Introduce":
                 # Authenticate the connection
                 if len(args) < 2:
-                    await websocket.send_json(
+                    await _send_json(websocket,
                         {"error": "Invalid Introduce arguments"}
                     )
                     continue
@@ -72,28 +97,36 @@ async def ai_chat_websocket(
                     app_store = AppStore(args[0])
                     pro_token = args[1]
                 except (ValueError, IndexError):
-                    await websocket.send_json({"error": "Invalid app store or token"})
+                    await _send_json(websocket, {"error": "Invalid app store or token"})
                     continue
 
-                # Verify purchase token
-                is_valid = await verification_service.is_valid_purchase_token(
-                    app_store, pro_token
-                )
+                # A session token from a previous Introduce lets reconnects
+                # skip the store-API verification round trip - the slowest
+                # step of the handshake during reconnect storms
+                session_token = args[2] if len(args) > 2 else None
+                if session_token and verify_session_token(
+                    session_token, app_store, pro_token
+                ):
+                    is_valid = True
+                else:
+                    # Verify purchase token
+                    is_valid = await verification_service.is_valid_purchase_token(
+                        app_store, pro_token
+                    )
 
                 if not is_valid:
-                    await websocket.send_json({"error": "Invalid purchase token"})
+                    await _send_json(websocket, {"error": "Invalid purchase token"})
                     await websocket.close(code=1008)  # Policy violation
                     return
 
                 # Check rate limits
-                rate_limiter = await get_rate_limit_service(rate_limit_db)
                 rate_limit_result = await rate_limiter.check_rate_limit(
                     app_store, pro_token
                 )
 
                 if rate_limit_result.is_rate_limited:
                     retry_after = rate_limit_result.retry_after
-                    await websocket.send_json(
+                    await _send_json(websocket,
                         {
                             "error": "Rate limit exceeded",
                             "retry_after": retry_after.isoformat()
@@ -106,29 +139,49 @@ async def ai_chat_websocket(
 
                 authenticated = True
                 planner.initialize_connection(connection_id)
+                await _send_json(
+                    websocket,
+                    {"session_token": issue_session_token(app_store, pro_token)},
+                )
                 await websocket.send_text("Authenticated. Ready to chat!")
-                logger.info(f"Connection {connection_id} authenticated")
+                logger.info("Connection %s authenticated", connection_id)
 
             elif method == "SendMessage":
                 if not authenticated:
-                    await websocket.send_json({"error": "Not authenticated"})
+                    await _send_json(websocket, {"error": "Not authenticated"})
                     continue
 
                 if len(args) < 1:
-                    await websocket.send_json({"error": "Message required"})
+                    await _send_json(websocket, {"error": "Message required"})
                     continue
 
                 user_message = args[0]
 
-                # Stream GPT response
+                # Stream GPT response with token coalescing
                 try:
+                    loop = asyncio.get_running_loop()
+                    buffer: list[str] = []
+                    buffered_len = 0
+                    last_flush = loop.time()
                     async for chunk in planner.stream_response(
                         connection_id, user_message
                     ):
-                        await websocket.send_text(chunk)
+                        buffer.append(chunk)
+                        buffered_len += len(chunk)
+                        now = loop.time()
+                        if (
+                            buffered_len >= _SEND_BUFFER_BYTES
+                            or now - last_flush >= _SEND_BUFFER_SECONDS
+                        ):
+                            await websocket.send_text("".join(buffer))
+                            buffer.clear()
+                            buffered_len = 0
+                            last_flush = now
+                    if buffer:
+                        await websocket.send_text("".join(buffer))
                 except Exception as e:
-                    logger.error(f"Error streaming response: {e}")
-                    await websocket.send_json({"error": str(e)})
+                    logger.error("Error streaming response: %s", e)
+                    await _send_json(websocket, {"error": str(e)})
 
             elif method == "StopInProgress":
                 planner.stop_generation(connection_id)
@@ -139,14 +192,14 @@ async def ai_chat_websocket(
                 await websocket.send_text("Chat restarted. Let's begin again!")
 
             else:
-                await websocket.send_json({"error": f"Unknown method: {method}"})
+                await _send_json(websocket, {"error": f"Unknown method: {method}"})
 
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected: {connection_id}")
+        logger.info("WebSocket disconnected: %s", connection_id)
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-        await websocket.send_json({"error": str(e)})
+        logger.error("WebSocket error: %s", e)
+        await _send_json(websocket, {"error": str(e)})
     finally:
         # Cleanup
         planner.cleanup_connection(connection_id)
-        logger.info(f"Cleaned up connection: {connection_id}")
+        logger.info("Cleaned up connection: %s", connection_id)
@@ -1,16 +1,60 @@
 """Password authentication helpers."""
 
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from app.services.password import PasswordService
+from app.services.user_loader import user_loader
 from app.models.database.user import User
-from app.core.exceptions import UnauthorizedException
+from app.core.exceptions import NotFoundException, UnauthorizedException
+
+# Verification results are cached briefly so repeated requests from the same
+# client don't re-run the 350k-iteration KDF on every call. The key is a
+# digest of the candidate password together with the stored hash and salt, so
+# a password change (which rewrites the stored hash) invalidates old entries
+# implicitly and the raw password is never kept around. Failures are cached
+# for a much shorter window so lockout/limit semantics stay intact.
+_CACHE_MAX_ENTRIES = 10_000
+_VERIFIED_TTL_SECONDS = 60.0
+_FAILED_TTL_SECONDS = 5.0
+_verification_cache: dict[str, tuple[float, bool]] = {}
+
+# Misses for the same key that arrive while a KDF is already running await
+# its result instead of each burning their own 350k iterations
+_in_flight: dict[str, asyncio.Future[bool]] = {}
+
+# The PBKDF2 derivation takes tens of milliseconds of pure CPU; run inside
+# the handler it would block the event loop and stall every other request in
+# flight. A bounded pool keeps concurrent KDFs from oversubscribing the CPU.
+_kdf_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="pw-kdf"
+)
+
+
+def _cache_key(password: str, user: User) -> str:
+    """Digest identifying a (password, stored credential) pair."""
+    digest = hashlib.sha256()
+    digest.update(password.encode("utf-8"))
+    digest.update(user.hashed_password.encode("utf-8"))
+    digest.update(user.salt)
+    return digest.hexdigest()
 
 
-def verify_user_password(
+async def verify_user_password(
     password: str, user: User, password_service: PasswordService
 ) -> None:
     """
     Verify user password and raise exception if invalid.
 
+    Cache hits resolve without leaving the event loop; misses run the KDF
+    on the bounded thread pool so other requests keep making progress.
+
     Args:
         password: Plain text password to verify
         user: User model with hashed password and salt
@@ -19,5 +63,84 @@ def verify_user_password(
     Raises:
         UnauthorizedException: If password is invalid
     """
-    if not password_service.verify_password(password, user.hashed_password, user.salt):
+    key = _cache_key(password, user)
+    now = time.monotonic()
+
+    cached = _verification_cache.get(key)
+    if cached is not None:
+        expires_at, verified = cached
+        if now < expires_at:
+            if verified:
+                return
+            raise UnauthorizedException("Invalid password")
+        del _verification_cache[key]
+
+    pending = _in_flight.get(key)
+    if pending is not None:
+        verified = await asyncio.shield(pending)
+    else:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        _in_flight[key] = future
+        try:
+            verified = await loop.run_in_executor(
+                _kdf_pool,
+                password_service.verify_password,
+                password,
+                user.hashed_password,
+                user.salt,
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # consume, waiters re-raise via shield
+            raise
+        else:
+            future.set_result(verified)
+        finally:
+            del _in_flight[key]
+
+        if len(_verification_cache) >= _CACHE_MAX_ENTRIES:
+            _verification_cache.clear()
+        ttl = _VERIFIED_TTL_SECONDS if verified else _FAILED_TTL_SECONDS
+        _verification_cache[key] = (now + ttl, verified)
+
+    if not verified:
         raise UnauthorizedException("Invalid password")
+
+
+async def authenticate_user(
+    user_id: UUID,
+    password: str,
+    db: AsyncSession,
+    password_service: PasswordService,
+) -> User:
+    """
+    Load a user by id and verify their password.
+
+    This is the shared prelude nearly every authenticated endpoint starts
+    with. The lookup goes through the coalescing user loader, so bursts of
+    concurrent auths share one IN query, and the KDF stays behind the
+    verification cache and thread pool. The returned User is a detached
+    read-only snapshot; mutate users through the caller's own session.
+
+    Args:
+        user_id: User UUID from the request body
+        password: Plain text password from the request body
+        db: The caller's request-scoped session; the coalesced lookup runs
+            against its engine, so dependency overrides apply
+        password_service: Password service for verification
+
+    Returns:
+        The authenticated User
+
+    Raises:
+        NotFoundException: If the user does not exist
+        UnauthorizedException: If the password is invalid
+    """
+    user = await user_loader.load(user_id, db)
+
+    if user is None:
+        raise NotFoundException("User not found")
+
+    await verify_user_password(password, user, password_service)
+    return user
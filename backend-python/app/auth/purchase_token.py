@@ -1,21 +1,47 @@
 """Purchase token authentication for FastAPI."""
 
 import logging
+import re
 from typing import Annotated
 from fastapi import Depends, Header, HTTPException, status
 from dataclasses import dataclass
 
 from app.core.enums import AppStore
-from app.core.exceptions import InvalidPurchaseTokenException
+from app.core.exceptions import INVALID_PURCHASE_TOKEN
 from app.services.purchase_verification.facade import (
-    PurchaseVerificationService,
     get_purchase_verification_service,
 )
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Enum(value) walks the member list and raises on miss; a dict lookup is a
+# single hash probe on a path that runs for every AI request
+_APP_STORE_BY_VALUE = {store.value: store for store in AppStore}
+
+# Lowercased auth-scheme prefix matched with a slice comparison below. If
+# another scheme is ever accepted, switch to the tuple form of
+# str.startswith, which scans all prefixes in one C-level pass
+_BEARER_PREFIX = "bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+# Cheap syntactic shape checks per store, run before any verification work.
+# A garbage token would otherwise cost an outbound store-API call (or, for
+# Web, an HMAC) per attempt; these reject obviously-malformed input in
+# O(len). Bounds are deliberately loose - anything a real store issues
+# passes comfortably.
+#   Google: Play purchaseTokens are alphanumeric with . _ -
+#   Apple:  base64 receipt data, potentially very long
+#   Web:    {user_id}.{timestamp}.{hex signature}
+#   RevenueCat: app user IDs, URL-safe
+_TOKEN_SHAPES: dict[AppStore, re.Pattern[str]] = {
+    AppStore.GOOGLE: re.compile(r"^[A-Za-z0-9._-]{16,2048}$"),
+    AppStore.APPLE: re.compile(r"^[A-Za-z0-9+/=_-]{16,65536}$"),
+    AppStore.WEB: re.compile(r"^[A-Za-z0-9-]{1,64}\.\d{1,20}\.[0-9a-f]{64}$"),
+    AppStore.REVENUECAT: re.compile(r"^[A-Za-z0-9$_.:@-]{1,256}$"),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class PurchaseTokenAuth:
     """Authentication context from purchase token."""
 
@@ -48,23 +74,24 @@ async def extract_purchase_token(
             detail="Missing Authorization header",
         )
 
-    # Parse header
-    parts = authorization.split()
+    # Single pass over the header: peel an optional "Bearer " prefix with a
+    # slice comparison, then split the remainder at most once instead of
+    # letting split() scan the whole token for further whitespace
+    value = authorization
+    if value[:_BEARER_PREFIX_LEN].lower() == _BEARER_PREFIX:
+        value = value[_BEARER_PREFIX_LEN:]
 
-    # Remove "Bearer" if present
-    if parts and parts[0].lower() == "bearer":
-        parts = parts[1:]
+    parts = value.split(" ", 1)
 
-    if len(parts) != 2:
+    if len(parts) != 2 or not parts[0] or not parts[1]:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Authorization header format",
         )
 
     # Parse AppStore enum
-    try:
-        app_store = AppStore(parts[0])
-    except ValueError:
+    app_store = _APP_STORE_BY_VALUE.get(parts[0])
+    if app_store is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid AppStore: {parts[0]}",
@@ -76,15 +103,16 @@ async def extract_purchase_token(
 
 
 async def require_purchase_token(
-    auth_data: Annotated[tuple[AppStore, str], Depends(extract_purchase_token)],
-    verification_service: Annotated[
-        PurchaseVerificationService, Depends(get_purchase_verification_service)
-    ],
+    authorization: Annotated[str | None, Header()] = None,
 ) -> PurchaseTokenAuth:
     """
     FastAPI dependency that requires valid purchase token.
 
     Use this as a dependency on routes that require purchase authentication.
+    This is deliberately a single flat dependency: FastAPI walks the
+    dependant tree on every request, so the header parse is a plain function
+    call here and the verification service comes straight from its module
+    singleton instead of each being their own Depends node.
 
     Example:
         @router.post("/ai/workout")
@@ -95,8 +123,7 @@ async def require_purchase_token(
             ...
 
     Args:
-        auth_data: Tuple of (AppStore, ProToken) from header
-        verification_service: Purchase verification service
+        authorization: Authorization header value
 
     Returns:
         PurchaseTokenAuth with validated token
@@ -104,16 +131,24 @@ async def require_purchase_token(
     Raises:
         InvalidPurchaseTokenException: If token is invalid
     """
-    app_store, pro_token = auth_data
+    app_store, pro_token = await extract_purchase_token(authorization)
+
+    # Reject tokens that can't possibly be genuine before spending a
+    # store-API round trip on them
+    shape = _TOKEN_SHAPES.get(app_store)
+    if shape is not None and shape.match(pro_token) is None:
+        logger.warning("Malformed purchase token for %s rejected pre-verify", app_store)
+        raise INVALID_PURCHASE_TOKEN
 
     # Verify the purchase token
+    verification_service = get_purchase_verification_service()
     result = await verification_service.verify_purchase(app_store, pro_token)
 
     if not result.is_valid:
         logger.warning(
-            f"Invalid purchase token for {app_store}: {result.error_message}"
+            "Invalid purchase token for %s: %s", app_store, result.error_message
         )
-        raise InvalidPurchaseTokenException()
+        raise INVALID_PURCHASE_TOKEN
 
     return PurchaseTokenAuth(
         app_store=app_store,
@@ -0,0 +1,75 @@
+"""Short-lived session tokens for WebSocket reconnects."""
+
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+from app.core.enums import AppStore
+
+_ALGORITHM = "HS256"
+_SESSION_TTL_SECONDS = 3600
+
+# Session tokens only need to survive reconnect storms, not process
+# restarts: with no configured secret an ephemeral per-process key is used
+# and a restart simply falls back to full purchase verification.
+_signing_key = settings.web_auth_secret_key or secrets.token_hex(32)
+
+
+def _subject(app_store: AppStore, pro_token: str) -> str:
+    """Digest binding a token to its store without embedding the raw token."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(app_store.value.encode())
+    digest.update(b"\x00")
+    digest.update(pro_token.encode())
+    return digest.hexdigest()
+
+
+def issue_session_token(app_store: AppStore, pro_token: str) -> str:
+    """
+    Issue a signed session token after successful purchase verification.
+
+    Args:
+        app_store: Store the purchase was verified against
+        pro_token: The verified purchase token
+
+    Returns:
+        Signed JWT valid for one hour
+    """
+    expires = datetime.now(timezone.utc) + timedelta(seconds=_SESSION_TTL_SECONDS)
+    token: str = jwt.encode(
+        {
+            "sub": _subject(app_store, pro_token),
+            "store": app_store.value,
+            "exp": expires,
+        },
+        _signing_key,
+        algorithm=_ALGORITHM,
+    )
+    return token
+
+
+def verify_session_token(
+    token: str, app_store: AppStore, pro_token: str
+) -> bool:
+    """
+    Check a session token against the credentials presented on reconnect.
+
+    Args:
+        token: JWT from a previous successful Introduce
+        app_store: Store presented on this connection
+        pro_token: Purchase token presented on this connection
+
+    Returns:
+        True if the token is valid, unexpired and bound to these credentials
+    """
+    try:
+        claims = jwt.decode(token, _signing_key, algorithms=[_ALGORITHM])
+    except JWTError:
+        return False
+    return bool(
+        claims.get("store") == app_store.value
+        and claims.get("sub") == _subject(app_store, pro_token)
+    )
@@ -1,5 +1,7 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import cached_property
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Literal
 
@@ -22,6 +24,10 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "postgresql+asyncpg://localhost/liftlog_user_data"
     rate_limit_database_url: str = "postgresql+asyncpg://localhost/liftlog_rate_limit"
+    # Connection pool sizing for the user-data engine, per worker process;
+    # size roughly to the target request concurrency of one worker
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
 
     # CORS
     cors_origins: str = "*"
@@ -45,6 +51,14 @@ class Settings(BaseSettings):
     # Web Auth
     web_auth_secret_key: str | None = None
 
+    # Auth snapshot cache (UserLoader): seconds an authenticated User row
+    # may be reused without re-querying. Invalidation is per-process, so
+    # with multiple workers a deleted or re-keyed account can keep
+    # authenticating on other workers for up to this long. Off by default;
+    # only enable on single-worker deployments or where that staleness is
+    # acceptable.
+    auth_snapshot_ttl_seconds: float = 0.0
+
     # Rate Limiting
     rate_limit_web_per_day: int = 100
     rate_limit_mobile_per_day: int = 20
@@ -60,9 +74,9 @@ class Settings(BaseSettings):
         """Check if running in production environment."""
         return self.environment == "production"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins into a list."""
+        """Parse CORS origins into a list (computed once per process)."""
         if self.cors_origins == "*":
             return ["*"]
         return [origin.strip() for origin in self.cors_origins.split(",")]
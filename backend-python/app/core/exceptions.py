@@ -45,5 +45,11 @@ class RateLimitException(HTTPException):
 class InvalidPurchaseTokenException(UnauthorizedException):
     """Raised when purchase token verification fails."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         super().__init__(detail="Invalid purchase token")
+
+
+# Prebuilt instance for the hot rejection path: FastAPI's handler only reads
+# status_code/detail/headers off the exception, so a shared immutable
+# instance is safe to raise repeatedly (and cheap under credential stuffing)
+INVALID_PURCHASE_TOKEN = InvalidPurchaseTokenException()
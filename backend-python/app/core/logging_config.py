@@ -1,14 +1,27 @@
 """Logging configuration for the application."""
 
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
 from app.core.config import settings
 
+# QueueListener draining log records on its background thread; started by
+# setup_logging and stopped via shutdown_logging at application shutdown
+_queue_listener: logging.handlers.QueueListener | None = None
 
-def setup_logging():
-    """Configure application logging with structured format."""
+
+def setup_logging() -> None:
+    """
+    Configure application logging with structured format.
+
+    Handlers sit behind a QueueHandler/QueueListener pair: log calls on the
+    event-loop thread only enqueue the record, while formatting and the
+    blocking file/stream writes happen on the listener's background thread.
+    """
+    global _queue_listener
 
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
@@ -33,22 +46,52 @@ def setup_logging():
     console_handler.setLevel(log_level)
     console_handler.setFormatter(console_formatter)
 
-    # File handler
-    file_handler = logging.FileHandler(log_dir / "liftlog.log")
-    file_handler.setLevel(log_level)
+    # File handlers rotate at 50MB (5 backups) so the logs directory cannot
+    # fill the disk, and delay=True defers opening until the first record.
+    # Each sits behind a MemoryHandler that batches writes and force-flushes
+    # whenever an ERROR-or-worse record arrives.
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "liftlog.log",
+        maxBytes=50_000_000,
+        backupCount=5,
+        encoding="utf-8",
+        delay=True,
+    )
     file_handler.setFormatter(file_formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=512, flushLevel=logging.ERROR, target=file_handler
+    )
+    buffered_file_handler.setLevel(log_level)
 
     # Error file handler
-    error_handler = logging.FileHandler(log_dir / "error.log")
-    error_handler.setLevel(logging.ERROR)
+    error_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "error.log",
+        maxBytes=50_000_000,
+        backupCount=5,
+        encoding="utf-8",
+        delay=True,
+    )
     error_handler.setFormatter(file_formatter)
+    buffered_error_handler = logging.handlers.MemoryHandler(
+        capacity=512, flushLevel=logging.ERROR, target=error_handler
+    )
+    buffered_error_handler.setLevel(logging.ERROR)
+
+    # Root logger gets only the queue handler; the real handlers hang off
+    # the listener thread so request handlers never block on disk I/O
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        buffered_file_handler,
+        buffered_error_handler,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
 
-    # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Reduce noise from third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -58,3 +101,15 @@ def setup_logging():
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
     logging.info(f"Logging configured at {settings.log_level.upper()} level")
+
+
+def shutdown_logging() -> None:
+    """Flush queued and buffered records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        listener = _queue_listener
+        _queue_listener = None
+        listener.stop()
+        # MemoryHandler.close() flushes any batched records to its target
+        for handler in listener.handlers:
+            handler.close()
@@ -1,4 +1,10 @@
-"""Database base configuration for SQLModel."""
+"""Database base configuration for SQLModel.
+
+Only Alembic's env.py imports this module; the running application never
+does, so these imports cost nothing at runtime. Routes and services import
+the models they use directly, which is what registers the tables for the
+startup create_all.
+"""
 
 from sqlmodel import SQLModel
 
@@ -9,5 +15,10 @@ from app.models.database.user_follow_secret import UserFollowSecret  # noqa: F40
 from app.models.database.user_inbox_item import UserInboxItem  # noqa: F401
 from app.models.database.shared_item import SharedItem  # noqa: F401
 from app.models.database.rate_limit import RateLimitConsumption  # noqa: F401
+from app.models.database.club import Club  # noqa: F401
+from app.models.database.club_event import ClubEvent  # noqa: F401
+from app.models.database.club_member import ClubMember  # noqa: F401
+from app.models.database.club_policy import ClubPolicy  # noqa: F401
+from app.models.database.club_profile_picture import ClubProfilePicture  # noqa: F401
 
 __all__ = ["SQLModel"]
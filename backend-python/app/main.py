@@ -3,10 +3,12 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlmodel import SQLModel
 
 from app.core.config import settings
-from app.core.logging_config import setup_logging
+from app.core.logging_config import setup_logging, shutdown_logging
 from app.db.session import user_data_engine, rate_limit_engine
 from app.api.routes import (
     users,
@@ -51,14 +53,18 @@ async def lifespan(app: FastAPI):
     scheduler.shutdown()
     await user_data_engine.dispose()
     await rate_limit_engine.dispose()
+    shutdown_logging()
 
 
 # Initialize FastAPI application
+# orjson serializes the base64-heavy encrypted payloads several times faster
+# than the stdlib encoder
 app = FastAPI(
     title="LiftLog API",
     version="2.0.0",
     description="Privacy-first fitness tracking backend with end-to-end encryption",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Configuration
@@ -70,6 +76,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the large list responses (search results, member listings, event
+# feeds); base64-encoded ciphertext still gzips ~2x. Small responses skip
+# compression entirely via minimum_size.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Add monitoring middleware
 app.add_middleware(RequestTrackingMiddleware)
 app.add_middleware(MetricsMiddleware)
@@ -1,9 +1,9 @@
 """Request tracking middleware for observability."""
 
 import logging
+import secrets
 import time
 from typing import Callable
-from uuid import uuid4
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -16,50 +16,62 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and track metrics."""
-        # Generate request ID
-        request_id = str(uuid4())
+        # In production the root logger runs at WARNING and both INFO
+        # records below are discarded; gate only those. The request ID is
+        # generated and returned unconditionally - clients quote it when
+        # reporting failures, and the error path logs the same ID, so
+        # correlation works regardless of log level. 8 random bytes as 16
+        # hex chars is plenty for that and skips the UUID object plus
+        # 36-char formatting.
+        track = logger.isEnabledFor(logging.INFO)
+
+        request_id = secrets.token_hex(8)
         request.state.request_id = request_id
 
-        # Start timer
-        start_time = time.time()
+        # Start timer; the metrics middleware (outermost) already read the
+        # monotonic clock for this request, so reuse its timestamp
+        start_ns = getattr(request.state, "start_ns", None)
+        if start_ns is None:
+            start_ns = time.perf_counter_ns()
 
         # Extract request metadata
         method = request.method
         path = request.url.path
-        client_host = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
-
-        # Log request start
-        logger.info(
-            "Request started",
-            extra={
-                "request_id": request_id,
-                "method": method,
-                "path": path,
-                "client_ip": client_host,
-                "user_agent": user_agent,
-            },
-        )
 
-        # Process request
-        try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Log request completion
+        if track:
+            # Log request start
             logger.info(
-                "Request completed",
+                "Request started",
                 extra={
                     "request_id": request_id,
                     "method": method,
                     "path": path,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration_ms, 2),
+                    "client_ip": request.client.host if request.client else "unknown",
+                    "user_agent": request.headers.get("user-agent", "unknown"),
                 },
             )
 
+        # Process request
+        try:
+            response = await call_next(request)
+
+            if track:
+                # Calculate duration; rounding is left to whatever formats
+                # the record, since the value is only carried in extra=
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+                # Log request completion
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "path": path,
+                        "status_code": response.status_code,
+                        "duration_ms": duration_ms,
+                    },
+                )
+
             # Add request ID to response headers
             response.headers["X-Request-ID"] = request_id
 
@@ -67,7 +79,7 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
 
         except Exception as e:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             # Log error
             logger.error(
@@ -76,7 +88,7 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
                     "request_id": request_id,
                     "method": method,
                     "path": path,
-                    "duration_ms": round(duration_ms, 2),
+                    "duration_ms": duration_ms,
                     "error": str(e),
                     "error_type": type(e).__name__,
                 },
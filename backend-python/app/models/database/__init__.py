@@ -9,6 +9,8 @@ from app.models.database.rate_limit import RateLimitConsumption
 from app.models.database.club import Club
 from app.models.database.club_member import ClubMember
 from app.models.database.club_event import ClubEvent
+from app.models.database.club_profile_picture import ClubProfilePicture
+from app.models.database.club_policy import ClubPolicy
 
 __all__ = [
     "User",
@@ -20,4 +22,6 @@ __all__ = [
     "Club",
     "ClubMember",
     "ClubEvent",
+    "ClubProfilePicture",
+    "ClubPolicy",
 ]
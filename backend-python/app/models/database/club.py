@@ -1,8 +1,11 @@
 """Club database model using SQLModel."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
 from sqlmodel import Field, SQLModel, Relationship
+from sqlalchemy import func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,23 +24,37 @@ class Club(SQLModel, table=True):
 
     __tablename__ = "clubs"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    owner_user_id: UUID = Field(foreign_key="users.id", nullable=False, index=True)
-    created: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    owner_user_id: UUID = Field(
+        foreign_key="users.id", nullable=False, index=True, ondelete="CASCADE"
+    )
+    # Set by the database (server_default now()) so inserts don't ship a
+    # client-side clock value over the wire
+    created: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    # Bumped on every club mutation (including policy/picture side-table
+    # changes, set explicitly by update_club); drives ETag revalidation
+    updated_at: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
 
     # Encrypted club metadata (encrypted with club's AES key)
+    # The encrypted profile picture lives in the club_profile_pictures side
+    # table (see ClubProfilePicture) so club metadata rows stay narrow.
     encrypted_name: bytes = Field(nullable=False, max_length=1024)
     encrypted_description: bytes | None = Field(default=None, max_length=5120)
-    encrypted_profile_picture: bytes | None = Field(default=None)
 
     # Encryption metadata
     encryption_iv: bytes = Field(nullable=False, max_length=16)
 
-    # Club settings
-    is_public: bool = Field(default=False, nullable=False)
-    members_can_post: bool = Field(default=True, nullable=False)
-    members_can_invite: bool = Field(default=False, nullable=False)
-    max_members: int = Field(default=0, nullable=False)  # 0 = unlimited
+    # Club settings (is_public, members_can_post, members_can_invite,
+    # max_members) live in the club_policies side table (see ClubPolicy) so
+    # flag toggles don't rewrite the encrypted blobs.
 
     # Relationships (cascade delete configured)
     members: list["ClubMember"] = Relationship(
@@ -1,9 +1,11 @@
 """ClubEvent database model using SQLModel."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
 from sqlmodel import Field, SQLModel, Relationship, Index
-from sqlalchemy import PrimaryKeyConstraint
+from sqlalchemy import PrimaryKeyConstraint, func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -23,17 +25,32 @@ class ClubEvent(SQLModel, table=True):
     __table_args__ = (
         PrimaryKeyConstraint("club_id", "id"),
         Index("ix_club_events_expiry", "expiry"),
-        Index("ix_club_events_club_id", "club_id"),
+        # Composite index answers per-club expiry sweeps
+        # (WHERE club_id = ? AND expiry < now()) with a single range scan
+        Index("ix_club_events_club_id_expiry", "club_id", "expiry"),
     )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     club_id: UUID = Field(
         foreign_key="clubs.id", primary_key=True, nullable=False, ondelete="CASCADE"
     )
     user_id: UUID = Field(
         foreign_key="users.id", nullable=False, index=True, ondelete="CASCADE"
     )
-    timestamp: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Set by the database (server_default now()) so event ordering follows
+    # one clock rather than whichever API node handled the post
+    timestamp: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    # Bumped when a re-post replaces the payload (timestamp deliberately is
+    # not); drives the feed ETag so replaced content revalidates
+    updated_at: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
     expiry: datetime = Field(nullable=False)
 
     # Encrypted event payload (max 5KB)
@@ -1,9 +1,11 @@
 """ClubMember database model using SQLModel."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
 from sqlmodel import Field, SQLModel, Relationship, Index
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,15 +23,31 @@ class ClubMember(SQLModel, table=True):
 
     __tablename__ = "club_members"
     __table_args__ = (
-        UniqueConstraint("club_id", "user_id", name="uq_club_user"),
-        Index("ix_club_members_club_id", "club_id"),
-        Index("ix_club_members_user_id", "user_id"),
+        # Uniqueness is enforced by a unique index rather than a constraint so
+        # it can carry INCLUDE (role): membership-plus-role checks become
+        # index-only scans that never touch the heap. Its left prefix also
+        # serves lookups by club_id alone, so no separate club_id index.
+        Index(
+            "uq_club_user",
+            "club_id",
+            "user_id",
+            unique=True,
+            postgresql_include=["role"],
+        ),
+        # (user_id, club_id) makes "which clubs is this user in" index-only
+        Index("ix_club_members_user_id", "user_id", "club_id"),
     )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     club_id: UUID = Field(foreign_key="clubs.id", nullable=False, ondelete="CASCADE")
     user_id: UUID = Field(foreign_key="users.id", nullable=False, ondelete="CASCADE")
-    joined: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Set by the database (server_default now()), keeping all membership
+    # timestamps in the server's clock domain
+    joined: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
 
     # Role: 'owner', 'admin', 'member', 'viewer'
     role: str = Field(nullable=False, max_length=20)
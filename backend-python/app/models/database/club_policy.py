@@ -0,0 +1,35 @@
+"""ClubPolicy database model using SQLModel."""
+
+from uuid import UUID
+from sqlmodel import Field, SQLModel, Index
+from sqlalchemy import text
+
+
+class ClubPolicy(SQLModel, table=True):
+    """
+    Club policy flags stored in a side table.
+
+    Visibility and permission flags change independently of the encrypted
+    club metadata. Keeping them in their own narrow row means toggling a
+    flag rewrites a few bytes instead of the whole clubs row with its
+    kilobytes of unchanged ciphertext (Postgres rewrites the full row on
+    every UPDATE).
+    """
+
+    __tablename__ = "club_policies"
+    __table_args__ = (
+        # Partial index keeps public-club counts and scans index-only
+        Index(
+            "ix_club_policies_public",
+            "club_id",
+            postgresql_where=text("is_public"),
+        ),
+    )
+
+    club_id: UUID = Field(
+        foreign_key="clubs.id", primary_key=True, ondelete="CASCADE"
+    )
+    is_public: bool = Field(default=False, nullable=False)
+    members_can_post: bool = Field(default=True, nullable=False)
+    members_can_invite: bool = Field(default=False, nullable=False)
+    max_members: int = Field(default=0, nullable=False)  # 0 = unlimited
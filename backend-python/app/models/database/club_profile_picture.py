@@ -0,0 +1,22 @@
+"""ClubProfilePicture database model using SQLModel."""
+
+from uuid import UUID
+from sqlmodel import Field, SQLModel
+
+
+class ClubProfilePicture(SQLModel, table=True):
+    """
+    Encrypted club profile picture stored in a side table.
+
+    Pictures are variable-length blobs that are only needed when rendering a
+    club profile. Keeping them out of the `clubs` table keeps the hot metadata
+    rows narrow, so scans over clubs never drag picture data through the
+    buffer cache.
+    """
+
+    __tablename__ = "club_profile_pictures"
+
+    club_id: UUID = Field(
+        foreign_key="clubs.id", primary_key=True, ondelete="CASCADE"
+    )
+    encrypted_profile_picture: bytes = Field(nullable=False)
@@ -1,8 +1,11 @@
 """RateLimitConsumption database model using SQLModel."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
-from sqlmodel import Field, SQLModel
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
+from sqlmodel import Field, Index, SQLModel
+from sqlalchemy import func
 
 
 class RateLimitConsumption(SQLModel, table=True):
@@ -14,8 +17,28 @@ class RateLimitConsumption(SQLModel, table=True):
     """
 
     __tablename__ = "rate_limit_consumptions"
+    __table_args__ = (
+        # Every query filters (hashed_token, app_store, timestamp >= cutoff)
+        # - the quota count and the oldest-entry lookup both resolve as one
+        # index range scan, and the ORDER BY timestamp LIMIT 1 reads the
+        # first entry straight off the index
+        Index(
+            "ix_rate_limit_token_store_timestamp",
+            "hashed_token",
+            "app_store",
+            "timestamp",
+        ),
+        # Serves the retention cleanup's batched timestamp < cutoff scans
+        Index("ix_rate_limit_consumptions_timestamp", "timestamp"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    hashed_token: str = Field(nullable=False, index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    hashed_token: str = Field(nullable=False)
     app_store: str = Field(nullable=False)  # AppStore enum as string
-    timestamp: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Set by the database (server_default now()) so the per-row insert
+    # payload shrinks on this append-heavy table
+    timestamp: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
@@ -2,7 +2,8 @@
 
 from datetime import datetime
 from uuid import UUID
-from sqlmodel import Field, SQLModel, Relationship
+from sqlmodel import Field, Index, SQLModel, Relationship
+from sqlalchemy import func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,10 +19,20 @@ class SharedItem(SQLModel, table=True):
     """
 
     __tablename__ = "shared_items"
+    __table_args__ = (
+        # Serves the expiry cleanup's batched expiry < now() scans
+        Index("ix_shared_items_expiry", "expiry"),
+    )
 
     id: str = Field(primary_key=True)  # CUID identifier
     user_id: UUID = Field(foreign_key="users.id", nullable=False, ondelete="CASCADE")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Server default; create_shared_item still sets it explicitly so the
+    # response can echo the value without a post-commit refresh
+    timestamp: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
     expiry: datetime = Field(nullable=False)
 
     # Encrypted payload (max 20KB)
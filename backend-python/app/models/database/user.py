@@ -1,8 +1,11 @@
 """User database model using SQLModel."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
 from sqlmodel import Field, SQLModel, Relationship
+from sqlalchemy import func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -24,12 +27,25 @@ class User(SQLModel, table=True):
 
     __tablename__ = "users"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_lookup: str = Field(unique=True, index=True, nullable=False)
-    hashed_password: str = Field(nullable=False)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    # 12-char CUIDs in practice (matching the original backend); bounded so
+    # oversized garbage can never bloat the unique-index entries
+    user_lookup: str = Field(unique=True, index=True, nullable=False, max_length=24)
+    # PBKDF2-SHA512 64-byte key as uppercase hex - always 128 chars
+    hashed_password: str = Field(nullable=False, max_length=128)
     salt: bytes = Field(nullable=False)
-    last_accessed: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    created: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Set by the database (server_default now()) so inserts don't ship
+    # client-side clock values over the wire
+    last_accessed: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    created: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
 
     # Encrypted user data (client-side encrypted)
     encrypted_current_plan: bytes | None = Field(default=None, nullable=True)
@@ -40,32 +56,57 @@ class User(SQLModel, table=True):
     encryption_iv: bytes = Field(nullable=False)
     rsa_public_key: bytes = Field(nullable=False)
 
-    # Relationships (cascade delete configured)
+    # Relationships. lazy="raise" makes any implicit lazy load a loud error
+    # instead of a silent N+1: routes read these tables with their own
+    # column selects, and anything that genuinely needs a collection must
+    # say so with selectinload() at the query site. passive_deletes defers
+    # cascade deletes to the ON DELETE CASCADE foreign keys, so deleting a
+    # user emits one DELETE instead of loading six collections first.
     events: list["UserEvent"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "lazy": "raise",
+            "passive_deletes": True,
+        },
     )
     follow_secrets: list["UserFollowSecret"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "lazy": "raise",
+            "passive_deletes": True,
+        },
     )
     inbox_items: list["UserInboxItem"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "lazy": "raise",
+            "passive_deletes": True,
+        },
     )
     shared_items: list["SharedItem"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "lazy": "raise",
+            "passive_deletes": True,
+        },
     )
     owned_clubs: list["Club"] = Relationship(
         sa_relationship_kwargs={
             "cascade": "all, delete-orphan",
+            "lazy": "raise",
+            "passive_deletes": True,
             "foreign_keys": "[Club.owner_user_id]",
         },
     )
     club_memberships: list["ClubMember"] = Relationship(
         sa_relationship_kwargs={
             "cascade": "all, delete-orphan",
+            "lazy": "raise",
+            "passive_deletes": True,
             "foreign_keys": "[ClubMember.user_id]",
         },
     )
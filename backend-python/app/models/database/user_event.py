@@ -1,9 +1,11 @@
 """UserEvent database model using SQLModel."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
 from sqlmodel import Field, SQLModel, Relationship, Column, Index
-from sqlalchemy import PrimaryKeyConstraint
+from sqlalchemy import PrimaryKeyConstraint, func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -22,12 +24,31 @@ class UserEvent(SQLModel, table=True):
     __table_args__ = (
         PrimaryKeyConstraint("user_id", "id"),
         Index("ix_user_events_expiry", "expiry"),
+        # The feed query filters (user_id, timestamp >= since) ordered
+        # ascending; this composite turns it into one index range scan per
+        # user. A covering INCLUDE variant was considered and rejected: the
+        # response needs encrypted_event, so an index-only scan would have
+        # to carry the 5KB payloads, roughly doubling table storage, and
+        # including only the small columns (id, iv, expiry) still leaves a
+        # heap fetch per row for the blob. DESC ordering is unnecessary -
+        # btree range scans run either direction and the feed doesn't sort.
+        Index("ix_user_events_user_timestamp", "user_id", "timestamp"),
     )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", primary_key=True, ondelete="CASCADE")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    last_accessed: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Set by the database (server_default now()) so inserts don't ship
+    # client-side clock values over the wire
+    timestamp: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    last_accessed: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
     expiry: datetime = Field(nullable=False)
 
     # Encrypted event payload (max 5KB)
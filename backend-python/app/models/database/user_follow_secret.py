@@ -1,8 +1,11 @@
 """UserFollowSecret database model using SQLModel."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
-from sqlmodel import Field, SQLModel, Relationship
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
+from sqlmodel import Field, Index, SQLModel, Relationship
+from sqlalchemy import func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,11 +20,32 @@ class UserFollowSecret(SQLModel, table=True):
     """
 
     __tablename__ = "user_follow_secrets"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    __table_args__ = (
+        # The batched feed validation probes (user_id, follow_secret) pairs;
+        # the unique composite makes that an index-only scan and lets writes
+        # upsert with ON CONFLICT instead of a guarded insert
+        Index(
+            "uq_user_follow_secrets_user_secret",
+            "user_id",
+            "follow_secret",
+            unique=True,
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", nullable=False, ondelete="CASCADE")
-    follow_secret: str = Field(nullable=False, index=True)
-    created: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # No single-column index: every lookup probes (user_id, follow_secret)
+    # pairs, which the unique composite above serves
+    # Clients send UUID strings (36 chars); 40 matches the original
+    # backend's declared maximum
+    follow_secret: str = Field(nullable=False, max_length=40)
+    # Set by the database (server_default now()) so inserts don't ship a
+    # client-side clock value over the wire
+    created: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
 
     # Relationships
     user: "User" = Relationship(back_populates="follow_secrets")
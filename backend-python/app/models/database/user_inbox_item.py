@@ -1,14 +1,44 @@
 """UserInboxItem database model using SQLModel."""
 
+import struct
+from collections.abc import Sequence
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from app.core.uuid7 import uuid7
 from sqlmodel import Field, SQLModel, Relationship, Column
-from sqlalchemy import ARRAY, LargeBinary
+from sqlalchemy import LargeBinary, func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.models.database.user import User
 
+# Each chunk is framed with a 4-byte big-endian length prefix inside the
+# single encrypted_message bytea (matches int4send() in migration 007)
+_CHUNK_LEN = struct.Struct(">I")
+
+
+def pack_message_chunks(chunks: Sequence[bytes]) -> bytes:
+    """Concatenate encrypted message chunks into one length-prefixed blob."""
+    parts: list[bytes] = []
+    for chunk in chunks:
+        parts.append(_CHUNK_LEN.pack(len(chunk)))
+        parts.append(chunk)
+    return b"".join(parts)
+
+
+def unpack_message_chunks(payload: bytes, chunk_count: int) -> list[bytes]:
+    """Split a packed blob back into its original chunk list."""
+    view = memoryview(payload)
+    chunks: list[bytes] = []
+    offset = 0
+    for _ in range(chunk_count):
+        (length,) = _CHUNK_LEN.unpack_from(view, offset)
+        offset += _CHUNK_LEN.size
+        chunks.append(bytes(view[offset : offset + length]))
+        offset += length
+    return chunks
+
 
 class UserInboxItem(SQLModel, table=True):
     """
@@ -20,15 +50,22 @@ class UserInboxItem(SQLModel, table=True):
 
     __tablename__ = "user_inbox_items"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", nullable=False, ondelete="CASCADE")
 
-    # Encrypted message chunks (array of byte arrays)
-    encrypted_message: list[bytes] = Field(
-        sa_column=Column(ARRAY(LargeBinary), nullable=False)
-    )
+    # Encrypted message chunks packed into one bytea (see
+    # pack_message_chunks). A bytea array stored each RSA chunk as its own
+    # TOAST-decoded array element; one blob is a single sequential fetch.
+    encrypted_message: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    chunk_count: int = Field(nullable=False)
 
-    created: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Set by the database (server_default now()) so inserts don't ship a
+    # client-side clock value over the wire
+    created: datetime = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
 
     # Relationships
     user: "User" = Relationship(back_populates="inbox_items")
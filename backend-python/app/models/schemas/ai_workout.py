@@ -1,6 +1,6 @@
 """AI workout request/response schemas using Pydantic."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.core.enums import ExperienceLevel
 
 
@@ -31,6 +31,10 @@ class AiSessionAttributes(BaseModel):
 class ExerciseBlueprint(BaseModel):
     """Single exercise in a workout."""
 
+    # Blueprints are immutable once parsed from the model output; nothing
+    # downstream mutates them, they are only serialized back out
+    model_config = ConfigDict(frozen=True)
+
     name: str
     sets: int
     reps_min: int
@@ -42,6 +46,8 @@ class ExerciseBlueprint(BaseModel):
 class SessionBlueprint(BaseModel):
     """Single workout session."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     exercises: list[ExerciseBlueprint]
     estimated_duration_minutes: int
@@ -50,6 +56,8 @@ class SessionBlueprint(BaseModel):
 class ProgramBlueprint(BaseModel):
     """Complete workout program."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     sessions: list[SessionBlueprint]
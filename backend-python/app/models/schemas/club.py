@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 from datetime import datetime
 
+from app.models.schemas.common import Base64Bytes
+
 
 # Club CRUD Operations
 
@@ -12,10 +14,10 @@ class CreateClubRequest(BaseModel):
 
     user_id: UUID
     password: str = Field(..., max_length=40)
-    encrypted_name: bytes = Field(..., max_length=1024)
-    encrypted_description: bytes | None = Field(None, max_length=5120)
-    encrypted_profile_picture: bytes | None = None
-    encryption_iv: bytes = Field(..., max_length=16)
+    encrypted_name: Base64Bytes = Field(..., max_length=1024)
+    encrypted_description: Base64Bytes | None = Field(None, max_length=5120)
+    encrypted_profile_picture: Base64Bytes | None = None
+    encryption_iv: Base64Bytes = Field(..., max_length=16)
     is_public: bool = False
     members_can_post: bool = True
     members_can_invite: bool = False
@@ -37,10 +39,10 @@ class GetClubResponse(BaseModel):
     id: UUID
     owner_user_id: UUID
     created: datetime
-    encrypted_name: bytes
-    encrypted_description: bytes | None
-    encrypted_profile_picture: bytes | None
-    encryption_iv: bytes
+    encrypted_name: Base64Bytes
+    encrypted_description: Base64Bytes | None
+    encrypted_profile_picture: Base64Bytes | None
+    encryption_iv: Base64Bytes
     is_public: bool
     members_can_post: bool
     members_can_invite: bool
@@ -54,10 +56,10 @@ class UpdateClubRequest(BaseModel):
     club_id: UUID
     user_id: UUID
     password: str = Field(..., max_length=40)
-    encrypted_name: bytes | None = Field(None, max_length=1024)
-    encrypted_description: bytes | None = Field(None, max_length=5120)
-    encrypted_profile_picture: bytes | None = None
-    encryption_iv: bytes | None = Field(None, max_length=16)
+    encrypted_name: Base64Bytes | None = Field(None, max_length=1024)
+    encrypted_description: Base64Bytes | None = Field(None, max_length=5120)
+    encrypted_profile_picture: Base64Bytes | None = None
+    encryption_iv: Base64Bytes | None = Field(None, max_length=16)
     is_public: bool | None = None
     members_can_post: bool | None = None
     members_can_invite: bool | None = None
@@ -78,13 +80,14 @@ class SearchClubsRequest(BaseModel):
     query: str | None = None  # Optional search term
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    include_total: bool = True  # Skip the count query for cheap paging
 
 
 class SearchClubsResponse(BaseModel):
     """Response containing search results."""
 
     clubs: list[GetClubResponse]
-    total: int
+    total: int  # -1 when the request opted out of the total
 
 
 class GetMyClubsRequest(BaseModel):
@@ -112,7 +115,7 @@ class ClubMemberResponse(BaseModel):
     user_id: UUID
     joined: datetime
     role: str  # 'owner', 'admin', 'member', 'viewer'
-    encrypted_aes_key: bytes
+    encrypted_aes_key: Base64Bytes
 
 
 class GetClubMembersRequest(BaseModel):
@@ -136,10 +139,10 @@ class InviteToClubRequest(BaseModel):
     inviter_user_id: UUID
     inviter_password: str = Field(..., max_length=40)
     invitee_user_id: UUID
-    encrypted_club_name: bytes  # Encrypted with invitee's public key
-    encrypted_club_description: bytes  # Encrypted with invitee's public key
-    encrypted_profile_picture: bytes | None
-    encrypted_aes_key: bytes  # Club AES key encrypted with invitee's public key
+    encrypted_club_name: Base64Bytes  # Encrypted with invitee's public key
+    encrypted_club_description: Base64Bytes  # Encrypted with invitee's public key
+    encrypted_profile_picture: Base64Bytes | None
+    encrypted_aes_key: Base64Bytes  # Club AES key encrypted with invitee's public key
     offered_role: str = Field(default="member")  # 'admin', 'member', 'viewer'
 
 
@@ -157,7 +160,7 @@ class AcceptClubInviteRequest(BaseModel):
     club_id: UUID
     user_id: UUID
     password: str = Field(..., max_length=40)
-    encrypted_aes_key: bytes  # From the invite
+    encrypted_aes_key: Base64Bytes  # From the invite
 
 
 class LeaveClubRequest(BaseModel):
@@ -199,8 +202,8 @@ class ClubEventResponse(BaseModel):
     user_id: UUID
     timestamp: datetime
     expiry: datetime
-    encrypted_event: bytes
-    encryption_iv: bytes
+    encrypted_event: Base64Bytes
+    encryption_iv: Base64Bytes
 
 
 class PostClubEventRequest(BaseModel):
@@ -210,8 +213,8 @@ class PostClubEventRequest(BaseModel):
     user_id: UUID
     password: str = Field(..., max_length=40)
     event_id: UUID
-    encrypted_event: bytes = Field(..., max_length=5120)
-    encryption_iv: bytes = Field(..., max_length=16)
+    encrypted_event: Base64Bytes = Field(..., max_length=5120)
+    encryption_iv: Base64Bytes = Field(..., max_length=16)
     expiry: datetime
 
 
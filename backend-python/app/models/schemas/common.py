@@ -0,0 +1,33 @@
+"""Shared field types for request/response schemas."""
+
+import base64
+import binascii
+from typing import Annotated, Any
+
+from pydantic import BeforeValidator, PlainSerializer
+
+
+def _decode_base64(value: Any) -> Any:
+    """Decode base64 strings from the wire; raw bytes pass through as-is."""
+    if isinstance(value, str):
+        try:
+            return base64.b64decode(value, validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise ValueError("Invalid base64 payload") from exc
+    return value
+
+
+# Binary payloads (encrypted blobs, IVs, RSA keys) travel as base64 strings,
+# matching how the C# backend serializes byte[]. Plain `bytes` fields would
+# try to utf-8 decode the raw blob at serialization time and fail on
+# arbitrary ciphertext; this annotation decodes on the way in and encodes in
+# one C-level b64encode on the way out.
+Base64Bytes = Annotated[
+    bytes,
+    BeforeValidator(_decode_base64),
+    PlainSerializer(
+        lambda value: base64.b64encode(value).decode("ascii"),
+        return_type=str,
+        when_used="json",
+    ),
+]
@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 
+from app.models.schemas.common import Base64Bytes
+
 
 class PutUserEventRequest(BaseModel):
     """Request to create or update a user event."""
@@ -11,8 +13,8 @@ class PutUserEventRequest(BaseModel):
     user_id: UUID
     password: str = Field(..., max_length=40)
     event_id: UUID
-    encrypted_event_payload: bytes = Field(..., max_length=5120)  # Max 5KB
-    encrypted_event_iv: bytes
+    encrypted_event_payload: Base64Bytes = Field(..., max_length=5120)  # Max 5KB
+    encrypted_event_iv: Base64Bytes
     expiry: datetime
 
 
@@ -36,8 +38,8 @@ class UserEventResponse(BaseModel):
     user_id: UUID
     event_id: UUID
     timestamp: datetime
-    encrypted_event_payload: bytes
-    encrypted_event_iv: bytes
+    encrypted_event_payload: Base64Bytes
+    encrypted_event_iv: Base64Bytes
     expiry: datetime
 
 
@@ -9,7 +9,7 @@ class PutUserFollowSecretRequest(BaseModel):
 
     user_id: UUID
     password: str = Field(..., max_length=40)
-    follow_secret: str
+    follow_secret: str = Field(..., max_length=40)
 
 
 class DeleteUserFollowSecretRequest(BaseModel):
@@ -17,4 +17,4 @@ class DeleteUserFollowSecretRequest(BaseModel):
 
     user_id: UUID
     password: str = Field(..., max_length=40)
-    follow_secret: str
+    follow_secret: str = Field(..., max_length=40)
@@ -3,12 +3,14 @@
 from pydantic import BaseModel, Field
 from uuid import UUID
 
+from app.models.schemas.common import Base64Bytes
+
 
 class PutInboxMessageRequest(BaseModel):
     """Request to send an encrypted message to a user's inbox."""
 
     to_user_id: UUID
-    encrypted_message: list[bytes]  # Chunked for RSA size limitations
+    encrypted_message: list[Base64Bytes]  # Chunked for RSA size limitations
 
 
 class GetInboxMessagesRequest(BaseModel):
@@ -22,7 +24,7 @@ class GetInboxMessageResponse(BaseModel):
     """Response containing a single inbox message."""
 
     id: UUID
-    encrypted_message: list[bytes]
+    encrypted_message: list[Base64Bytes]
 
 
 class GetInboxMessagesResponse(BaseModel):
@@ -4,14 +4,16 @@ from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 
+from app.models.schemas.common import Base64Bytes
+
 
 class PostSharedItemRequest(BaseModel):
     """Request to create a publicly shareable workout item."""
 
     user_id: UUID
     password: str = Field(..., max_length=40)
-    encrypted_payload: bytes = Field(..., max_length=20480)  # Max 20KB
-    encryption_iv: bytes
+    encrypted_payload: Base64Bytes = Field(..., max_length=20480)  # Max 20KB
+    encryption_iv: Base64Bytes
     expiry: datetime
 
 
@@ -21,6 +23,6 @@ class GetSharedItemResponse(BaseModel):
     id: str  # CUID
     user_id: UUID
     timestamp: datetime
-    encrypted_payload: bytes
-    encryption_iv: bytes
+    encrypted_payload: Base64Bytes
+    encryption_iv: Base64Bytes
     expiry: datetime
@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 from datetime import datetime
 
+from app.models.schemas.common import Base64Bytes
+
 
 class CreateUserRequest(BaseModel):
     """Empty request body for user creation."""
@@ -24,11 +26,11 @@ class PutUserDataRequest(BaseModel):
 
     id: UUID
     password: str = Field(..., max_length=40)
-    encrypted_current_plan: bytes | None = None
-    encrypted_profile_picture: bytes | None = Field(None, max_length=2_097_152)  # 2MB max
-    encrypted_name: bytes | None = None
-    encryption_iv: bytes
-    rsa_public_key: bytes
+    encrypted_current_plan: Base64Bytes | None = None
+    encrypted_profile_picture: Base64Bytes | None = Field(None, max_length=2_097_152)  # 2MB max
+    encrypted_name: Base64Bytes | None = None
+    encryption_iv: Base64Bytes
+    rsa_public_key: Base64Bytes
 
 
 class GetUserResponse(BaseModel):
@@ -38,11 +40,11 @@ class GetUserResponse(BaseModel):
 
     id: UUID
     lookup: str
-    encrypted_current_plan: bytes | None
-    encrypted_profile_picture: bytes | None
-    encrypted_name: bytes | None
-    encryption_iv: bytes
-    rsa_public_key: bytes
+    encrypted_current_plan: Base64Bytes | None
+    encrypted_profile_picture: Base64Bytes | None
+    encrypted_name: Base64Bytes | None
+    encryption_iv: Base64Bytes
+    rsa_public_key: Base64Bytes
 
 
 class DeleteUserRequest(BaseModel):
@@ -50,7 +50,7 @@ Guidelines:
 - Focus on sustainable, long-term fitness habits""",
             }
         ]
-        logger.info(f"Initialized chat conversation for {connection_id}")
+        logger.info("Initialized chat conversation for %s", connection_id)
 
     async def stream_response(
         self, connection_id: str, user_message: str
@@ -98,7 +98,7 @@ Guidelines:
             )
 
         except Exception as e:
-            logger.error(f"Error streaming GPT response: {e}")
+            logger.error("Error streaming GPT response: %s", e)
             yield f"\n\n[Error: {str(e)}]"
 
     def stop_generation(self, connection_id: str) -> None:
@@ -112,7 +112,7 @@ Guidelines:
             task = self._active_streams[connection_id]
             task.cancel()
             del self._active_streams[connection_id]
-            logger.info(f"Stopped generation for {connection_id}")
+            logger.info("Stopped generation for %s", connection_id)
 
     def restart_chat(self, connection_id: str) -> None:
         """
@@ -124,7 +124,7 @@ Guidelines:
         if connection_id in self._conversations:
             del self._conversations[connection_id]
         self.initialize_connection(connection_id)
-        logger.info(f"Restarted chat for {connection_id}")
+        logger.info("Restarted chat for %s", connection_id)
 
     def cleanup_connection(self, connection_id: str) -> None:
         """
@@ -138,7 +138,7 @@ Guidelines:
         if connection_id in self._active_streams:
             self._active_streams[connection_id].cancel()
             del self._active_streams[connection_id]
-        logger.info(f"Cleaned up connection {connection_id}")
+        logger.info("Cleaned up connection %s", connection_id)
 
     def get_conversation_length(self, connection_id: str) -> int:
         """Get number of messages in conversation."""
@@ -2,7 +2,10 @@
 
 import logging
 import json
+from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Any
+import httpx
 from openai import AsyncOpenAI
 
 from app.core.config import settings
@@ -16,6 +19,125 @@ from app.models.schemas.ai_workout import (
 
 logger = logging.getLogger(__name__)
 
+# Function schemas for structured output, shared by the blocking and
+# streaming generation paths
+WORKOUT_PLAN_FUNCTION_SCHEMA = {
+    "name": "create_workout_plan",
+    "description": "Create a personalized workout program",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "description": "Program name"},
+            "description": {"type": "string", "description": "Program description"},
+            "duration_weeks": {"type": "integer", "description": "Program duration in weeks"},
+            "sessions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "estimated_duration_minutes": {"type": "integer"},
+                        "exercises": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "sets": {"type": "integer"},
+                                    "reps_min": {"type": "integer"},
+                                    "reps_max": {"type": "integer"},
+                                    "rest_seconds": {"type": "integer"},
+                                    "notes": {"type": "string"},
+                                },
+                                "required": ["name", "sets", "reps_min", "reps_max", "rest_seconds"],
+                            },
+                        },
+                    },
+                    "required": ["name", "estimated_duration_minutes", "exercises"],
+                },
+            },
+        },
+        "required": ["name", "description", "duration_weeks", "sessions"],
+    },
+}
+
+SESSION_FUNCTION_SCHEMA = {
+    "name": "create_workout_session",
+    "description": "Create a single workout session",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "estimated_duration_minutes": {"type": "integer"},
+            "exercises": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "sets": {"type": "integer"},
+                        "reps_min": {"type": "integer"},
+                        "reps_max": {"type": "integer"},
+                        "rest_seconds": {"type": "integer"},
+                        "notes": {"type": "string"},
+                    },
+                    "required": ["name", "sets", "reps_min", "reps_max", "rest_seconds"],
+                },
+            },
+        },
+        "required": ["name", "estimated_duration_minutes", "exercises"],
+    },
+}
+
+
+def _scan_complete_sessions(buffer: str) -> list[str]:
+    """
+    Extract complete session objects from a partial function-call payload.
+
+    Scans the streamed JSON text for the "sessions" array and returns the raw
+    text of every object whose closing brace has already arrived. String
+    literals and escapes are tracked so braces inside strings don't confuse
+    the scan.
+    """
+    key_index = buffer.find('"sessions"')
+    if key_index == -1:
+        return []
+    array_start = buffer.find("[", key_index)
+    if array_start == -1:
+        return []
+
+    sessions: list[str] = []
+    depth = 0
+    in_string = False
+    escaped = False
+    object_start = -1
+
+    for i in range(array_start + 1, len(buffer)):
+        char = buffer[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char == "{":
+            if depth == 0:
+                object_start = i
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0 and object_start != -1:
+                sessions.append(buffer[object_start : i + 1])
+                object_start = -1
+        elif char == "]" and depth == 0:
+            break
+
+    return sessions
+
 
 class GptAiWorkoutPlanner:
     """
@@ -24,9 +146,16 @@ class GptAiWorkoutPlanner:
     Generates personalized workout plans and sessions based on user attributes.
     """
 
-    def __init__(self):
-        """Initialize OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+    def __init__(self) -> None:
+        """Initialize OpenAI client with a bounded keep-alive pool."""
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20
+                ),
+            ),
+        )
         self.model = settings.openai_model
 
     async def generate_workout_plan(
@@ -44,47 +173,6 @@ class GptAiWorkoutPlanner:
         # Construct the prompt
         prompt = self._build_workout_plan_prompt(attributes)
 
-        # Define function schema for structured output
-        function_schema = {
-            "name": "create_workout_plan",
-            "description": "Create a personalized workout program",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Program name"},
-                    "description": {"type": "string", "description": "Program description"},
-                    "duration_weeks": {"type": "integer", "description": "Program duration in weeks"},
-                    "sessions": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "estimated_duration_minutes": {"type": "integer"},
-                                "exercises": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "name": {"type": "string"},
-                                            "sets": {"type": "integer"},
-                                            "reps_min": {"type": "integer"},
-                                            "reps_max": {"type": "integer"},
-                                            "rest_seconds": {"type": "integer"},
-                                            "notes": {"type": "string"},
-                                        },
-                                        "required": ["name", "sets", "reps_min", "reps_max", "rest_seconds"],
-                                    },
-                                },
-                            },
-                            "required": ["name", "estimated_duration_minutes", "exercises"],
-                        },
-                    },
-                },
-                "required": ["name", "description", "duration_weeks", "sessions"],
-            },
-        }
-
         try:
             # Call GPT-4o with function calling
             response = await self.client.chat.completions.create(
@@ -96,7 +184,7 @@ class GptAiWorkoutPlanner:
                     },
                     {"role": "user", "content": prompt},
                 ],
-                functions=[function_schema],
+                functions=[WORKOUT_PLAN_FUNCTION_SCHEMA],
                 function_call={"name": "create_workout_plan"},
                 temperature=0.7,
             )
@@ -130,35 +218,6 @@ class GptAiWorkoutPlanner:
         # Construct the prompt
         prompt = self._build_session_prompt(attributes)
 
-        # Define function schema
-        function_schema = {
-            "name": "create_workout_session",
-            "description": "Create a single workout session",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "estimated_duration_minutes": {"type": "integer"},
-                    "exercises": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "sets": {"type": "integer"},
-                                "reps_min": {"type": "integer"},
-                                "reps_max": {"type": "integer"},
-                                "rest_seconds": {"type": "integer"},
-                                "notes": {"type": "string"},
-                            },
-                            "required": ["name", "sets", "reps_min", "reps_max", "rest_seconds"],
-                        },
-                    },
-                },
-                "required": ["name", "estimated_duration_minutes", "exercises"],
-            },
-        }
-
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -169,7 +228,7 @@ class GptAiWorkoutPlanner:
                     },
                     {"role": "user", "content": prompt},
                 ],
-                functions=[function_schema],
+                functions=[SESSION_FUNCTION_SCHEMA],
                 function_call={"name": "create_workout_session"},
                 temperature=0.7,
             )
@@ -186,6 +245,77 @@ class GptAiWorkoutPlanner:
             logger.error(f"Error generating workout session: {e}")
             raise
 
+    async def stream_workout_plan(
+        self, attributes: AiWorkoutAttributes
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a workout program as newline-delimited JSON.
+
+        Yields each SessionBlueprint as soon as GPT-4o finishes emitting it,
+        so clients can render the first session without waiting for the full
+        program. A final line carries the program-level metadata (name,
+        description, duration) once the payload is complete.
+
+        Args:
+            attributes: User attributes for personalization
+
+        Yields:
+            NDJSON lines: one per session, then one for the program metadata
+        """
+        prompt = self._build_workout_plan_prompt(attributes)
+
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert fitness coach and personal trainer with deep knowledge of exercise science, program design, and progressive overload.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                functions=[WORKOUT_PLAN_FUNCTION_SCHEMA],
+                function_call={"name": "create_workout_plan"},
+                temperature=0.7,
+                stream=True,
+            )
+
+            buffer = ""
+            emitted = 0
+
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                function_call = chunk.choices[0].delta.function_call
+                if function_call is None or not function_call.arguments:
+                    continue
+
+                buffer += function_call.arguments
+
+                # Validate and emit any sessions that completed in this chunk
+                sessions = _scan_complete_sessions(buffer)
+                for raw_session in sessions[emitted:]:
+                    session = self._parse_session_blueprint(json.loads(raw_session))
+                    yield session.model_dump_json() + "\n"
+                emitted = len(sessions)
+
+            # Emit program-level metadata once the full payload has arrived.
+            # Every session was already validated and emitted as it streamed
+            # and the final line excludes them anyway, so only the program
+            # scalars go through validation a second time
+            data = json.loads(buffer)
+            plan = ProgramBlueprint(
+                name=data["name"],
+                description=data["description"],
+                duration_weeks=data["duration_weeks"],
+                sessions=[],
+            )
+            yield plan.model_dump_json(exclude={"sessions"}) + "\n"
+
+        except Exception as e:
+            logger.error(f"Error streaming workout plan: {e}")
+            raise
+
     def _build_workout_plan_prompt(self, attrs: AiWorkoutAttributes) -> str:
         """Build prompt for workout plan generation."""
         return f"""Create a personalized {attrs.days_per_week}-day per week workout program for:
@@ -261,13 +391,11 @@ Design an effective workout that:
         )
 
 
-# Singleton instance
-_gpt_ai_workout_planner: GptAiWorkoutPlanner | None = None
-
-
+@lru_cache(maxsize=1)
 def get_gpt_ai_workout_planner() -> GptAiWorkoutPlanner:
-    """Dependency injection for GPT AI workout planner."""
-    global _gpt_ai_workout_planner
-    if _gpt_ai_workout_planner is None:
-        _gpt_ai_workout_planner = GptAiWorkoutPlanner()
-    return _gpt_ai_workout_planner
+    """Dependency injection for GPT AI workout planner.
+
+    Cached per process so the OpenAI client and its keep-alive connection
+    pool are reused across requests instead of being re-created by Depends.
+    """
+    return GptAiWorkoutPlanner()
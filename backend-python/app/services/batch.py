@@ -0,0 +1,41 @@
+"""Batched lookup helpers for multi-user endpoints."""
+
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.database.user_follow_secret import UserFollowSecret
+
+
+async def batch_fetch_follow_secrets(
+    db: AsyncSession, pairs: list[tuple[UUID, str]]
+) -> set[tuple[UUID, str]]:
+    """
+    Validate many (user_id, follow_secret) pairs in one query.
+
+    Checking each pair with its own SELECT makes feed refreshes pay one
+    round trip per followed user; a single row-value IN list answers all of
+    them at once.
+
+    Args:
+        db: Database session
+        pairs: (user_id, follow_secret) pairs to validate
+
+    Returns:
+        The subset of pairs that exist
+    """
+    if not pairs:
+        return set()
+
+    result = await db.execute(
+        select(
+            col(UserFollowSecret.user_id), col(UserFollowSecret.follow_secret)
+        ).where(
+            tuple_(
+                col(UserFollowSecret.user_id), col(UserFollowSecret.follow_secret)
+            ).in_(pairs)
+        )
+    )
+    return {(user_id, follow_secret) for user_id, follow_secret in result.all()}
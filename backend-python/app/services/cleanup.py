@@ -1,79 +1,158 @@
 """Background cleanup service for expired data."""
 
 import logging
-from datetime import datetime
-from sqlmodel import select
+from typing import Any, cast
+
+from sqlalchemy import Delete, delete, func, text, tuple_
+from sqlalchemy.engine import CursorResult
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.database.user_event import UserEvent
 from app.models.database.shared_item import SharedItem
+from app.models.database.club_event import ClubEvent
+from app.models.database.rate_limit import RateLimitConsumption
 
 logger = logging.getLogger(__name__)
 
+# Expired rows are removed in bounded batches so each DELETE holds locks
+# and generates WAL for at most this many rows; an unbounded DELETE over a
+# large backlog can stall writers and flood replication for minutes
+CLEANUP_BATCH_SIZE = 10_000
+
+# Rate limit rows stop mattering once they fall out of the 24-hour sliding
+# window; keep one extra day of slack before removing them
+RATE_LIMIT_RETENTION = text("interval '2 days'")
+
 
 class CleanupService:
     """Service for cleaning up expired data from the database."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, rate_limit_db: AsyncSession | None = None):
         """
         Initialize cleanup service.
 
         Args:
-            db: Database session for cleanup operations
+            db: User data database session for cleanup operations
+            rate_limit_db: Rate limit database session; when omitted, rate
+                limit consumption cleanup is skipped
         """
         self.db = db
+        self.rate_limit_db = rate_limit_db
+
+    async def _delete_in_batches(self, db: AsyncSession, stmt: Delete) -> int:
+        """Run a batched DELETE until a batch comes back short."""
+        deleted_count = 0
+        while True:
+            result = cast(CursorResult[Any], await db.execute(stmt))
+            await db.commit()
+            deleted_count += result.rowcount
+            if result.rowcount < CLEANUP_BATCH_SIZE:
+                break
+        return deleted_count
 
     async def cleanup_expired_events(self) -> int:
         """
-        Delete expired user events.
+        Delete expired user events in batches.
 
         Returns:
             Number of events deleted
         """
-        now = datetime.utcnow()
-
-        # Find expired events
-        result = await self.db.execute(
-            select(UserEvent).where(UserEvent.expiry < now)
+        # The expiry scan is served by ix_user_events_expiry; deletion is by
+        # the (user_id, id) primary key selected in each batch
+        batch = (
+            select(col(UserEvent.user_id), col(UserEvent.id))
+            .where(col(UserEvent.expiry) < func.now())
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        stmt = delete(UserEvent).where(
+            tuple_(col(UserEvent.user_id), col(UserEvent.id)).in_(batch)
         )
-        expired_events = result.scalars().all()
-
-        # Delete expired events
-        for event in expired_events:
-            await self.db.delete(event)
-
-        await self.db.commit()
 
-        deleted_count = len(expired_events)
+        deleted_count = await self._delete_in_batches(self.db, stmt)
         if deleted_count > 0:
-            logger.info(f"Deleted {deleted_count} expired events")
+            logger.info("Deleted %d expired events", deleted_count)
 
         return deleted_count
 
     async def cleanup_expired_shared_items(self) -> int:
         """
-        Delete expired shared items.
+        Delete expired shared items in batches.
 
         Returns:
             Number of shared items deleted
         """
-        now = datetime.utcnow()
+        batch = (
+            select(col(SharedItem.id))
+            .where(col(SharedItem.expiry) < func.now())
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        stmt = delete(SharedItem).where(col(SharedItem.id).in_(batch))
+
+        deleted_count = await self._delete_in_batches(self.db, stmt)
+        if deleted_count > 0:
+            logger.info("Deleted %d expired shared items", deleted_count)
+
+        return deleted_count
+
+    async def cleanup_expired_club_events(self) -> int:
+        """
+        Delete expired club events in batches.
 
-        # Find expired shared items
-        result = await self.db.execute(
-            select(SharedItem).where(SharedItem.expiry < now)
+        Events are kept for a one-day grace period past their expiry (reads
+        already filter on expiry > now(), so they are invisible either way).
+        Set-based batched deletes keep the live working set — and therefore
+        the feed query's index scans — small without long-held locks.
+
+        Returns:
+            Number of club events deleted
+        """
+        # The expiry scan is served by ix_club_events_expiry; deletion is by
+        # the (club_id, id) primary key selected in each batch
+        batch = (
+            select(col(ClubEvent.club_id), col(ClubEvent.id))
+            .where(col(ClubEvent.expiry) < func.now() - text("interval '1 day'"))
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        stmt = delete(ClubEvent).where(
+            tuple_(col(ClubEvent.club_id), col(ClubEvent.id)).in_(batch)
         )
-        expired_items = result.scalars().all()
 
-        # Delete expired items
-        for item in expired_items:
-            await self.db.delete(item)
+        deleted_count = await self._delete_in_batches(self.db, stmt)
+        if deleted_count > 0:
+            logger.info("Deleted %d expired club events", deleted_count)
+
+        return deleted_count
 
-        await self.db.commit()
+    async def cleanup_stale_rate_limit_consumptions(self) -> int:
+        """
+        Delete rate limit consumption rows past the retention window.
 
-        deleted_count = len(expired_items)
+        The rate limiter only ever counts rows from the last 24 hours, so
+        anything older than the retention window is dead weight that slows
+        the per-request count scans.
+
+        Returns:
+            Number of consumption rows deleted
+        """
+        if self.rate_limit_db is None:
+            return 0
+
+        # The timestamp scan is served by ix_rate_limit_consumptions_timestamp
+        batch = (
+            select(col(RateLimitConsumption.id))
+            .where(
+                col(RateLimitConsumption.timestamp) < func.now() - RATE_LIMIT_RETENTION
+            )
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        stmt = delete(RateLimitConsumption).where(
+            col(RateLimitConsumption.id).in_(batch)
+        )
+
+        deleted_count = await self._delete_in_batches(self.rate_limit_db, stmt)
         if deleted_count > 0:
-            logger.info(f"Deleted {deleted_count} expired shared items")
+            logger.info("Deleted %d stale rate limit consumptions", deleted_count)
 
         return deleted_count
 
@@ -88,12 +167,18 @@ class CleanupService:
 
         events_deleted = await self.cleanup_expired_events()
         shared_deleted = await self.cleanup_expired_shared_items()
+        club_events_deleted = await self.cleanup_expired_club_events()
+        rate_limits_deleted = await self.cleanup_stale_rate_limit_consumptions()
 
-        total = events_deleted + shared_deleted
-        logger.info(f"Cleanup complete. Total deleted: {total} items")
+        total = (
+            events_deleted + shared_deleted + club_events_deleted + rate_limits_deleted
+        )
+        logger.info("Cleanup complete. Total deleted: %d items", total)
 
         return {
             "events_deleted": events_deleted,
             "shared_items_deleted": shared_deleted,
+            "club_events_deleted": club_events_deleted,
+            "rate_limits_deleted": rate_limits_deleted,
             "total_deleted": total,
         }
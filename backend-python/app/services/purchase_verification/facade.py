@@ -1,6 +1,10 @@
 """Facade service for routing purchase verification to appropriate service."""
 
+import asyncio
+import hashlib
 import logging
+import time
+
 from app.core.enums import AppStore
 from app.services.purchase_verification.base import (
     BasePurchaseVerificationService,
@@ -21,6 +25,14 @@ from app.services.purchase_verification.web_auth import (
 
 logger = logging.getLogger(__name__)
 
+# Store-API verification is the slowest external call in the app; valid
+# results are reused for a few minutes so repeat checks (reconnects,
+# successive AI requests) skip the round trip. Failures get a short window
+# so a freshly completed purchase isn't locked out for long.
+_CACHE_MAX_ENTRIES = 10_000
+_VALID_TTL_SECONDS = 300.0
+_INVALID_TTL_SECONDS = 30.0
+
 
 class PurchaseVerificationService:
     """
@@ -37,6 +49,19 @@ class PurchaseVerificationService:
             AppStore.REVENUECAT: RevenueCatPurchaseVerificationService(),
             AppStore.WEB: WebAuthPurchaseVerificationService(),
         }
+        self._result_cache: dict[str, tuple[float, PurchaseVerificationResult]] = {}
+        # Concurrent misses for the same token share one in-flight store-API
+        # call instead of each launching their own (same single-flight
+        # pattern as the password KDF cache)
+        self._in_flight: dict[str, asyncio.Future[PurchaseVerificationResult]] = {}
+
+    @staticmethod
+    def _cache_key(app_store: AppStore, pro_token: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(app_store.value.encode())
+        digest.update(b"\x00")
+        digest.update(pro_token.encode())
+        return digest.hexdigest()
 
     async def is_valid_purchase_token(
         self, app_store: AppStore, pro_token: str
@@ -53,12 +78,7 @@ class PurchaseVerificationService:
         Returns:
             True if valid, False otherwise
         """
-        service = self._services.get(app_store)
-        if not service:
-            logger.warning(f"No verification service for app store: {app_store}")
-            return False
-
-        result = await service.verify_purchase(pro_token)
+        result = await self.verify_purchase(app_store, pro_token)
         return result.is_valid
 
     async def verify_purchase(
@@ -76,14 +96,49 @@ class PurchaseVerificationService:
         """
         service = self._services.get(app_store)
         if not service:
-            logger.warning(f"No verification service for app store: {app_store}")
+            logger.warning("No verification service for app store: %s", app_store)
             return PurchaseVerificationResult(
                 is_valid=False,
                 app_store=app_store,
                 error_message=f"No service configured for {app_store}",
             )
 
-        return await service.verify_purchase(pro_token)
+        key = self._cache_key(app_store, pro_token)
+        now = time.monotonic()
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if now < expires_at:
+                return result
+            del self._result_cache[key]
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[PurchaseVerificationResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        try:
+            result = await service.verify_purchase(pro_token)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Waiters re-raise this; consume it here so an unawaited future
+            # doesn't log a warning when no one else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._in_flight[key]
+
+        if len(self._result_cache) >= _CACHE_MAX_ENTRIES:
+            self._result_cache.clear()
+        ttl = _VALID_TTL_SECONDS if result.is_valid else _INVALID_TTL_SECONDS
+        self._result_cache[key] = (now + ttl, result)
+
+        return result
 
     async def close(self):
         """Close all HTTP clients."""
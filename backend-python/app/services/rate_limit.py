@@ -1,18 +1,51 @@
 """Rate limiting service using PostgreSQL storage."""
 
+import asyncio
 import logging
 import hashlib
+import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from sqlmodel import select, func
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy import insert
+from sqlmodel import col, select, func
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.db.session import get_rate_limit_db
 from app.core.enums import AppStore
 from app.models.database.rate_limit import RateLimitConsumption
 
 logger = logging.getLogger(__name__)
 
+# Both per-token maps below are cleared wholesale when they hit this bound
+# rather than evicting per-entry; a full clear only costs the next request
+# per bucket one extra DB round trip (or one fresh lock)
+_MAX_ENTRIES = 10_000
+
+# Per-bucket locks serialize concurrent rate limit checks for the same
+# (app_store, pro_token) in-process, so a burst of requests from one client
+# holds at most one rate limit DB connection per bucket instead of draining
+# the pool with concurrent check-then-insert round trips.
+_bucket_locks: dict[tuple[str, str], asyncio.Lock] = {}
+_bucket_locks_guard = asyncio.Lock()
+
+# Short-lived cache of "recently allowed" decisions. A burst of requests for
+# the same token inside the TTL reuses the last non-limited result instead of
+# hitting the database for every call. Rate-limited results are never cached,
+# so users unblock as soon as their window shifts.
+_ALLOWED_CACHE_TTL_SECONDS = 1.0
+_recently_allowed: dict[tuple[str, str], tuple[float, "RateLimitResult"]] = {}
+
+
+async def _get_bucket_lock(key: tuple[str, str]) -> asyncio.Lock:
+    """Get (or lazily create) the lock for a rate limit bucket."""
+    async with _bucket_locks_guard:
+        if key not in _bucket_locks and len(_bucket_locks) >= _MAX_ENTRIES:
+            _bucket_locks.clear()
+        return _bucket_locks.setdefault(key, asyncio.Lock())
+
 
 @dataclass
 class RateLimitResult:
@@ -22,6 +55,7 @@ class RateLimitResult:
     retry_after: datetime | None = None
     requests_made: int = 0
     requests_allowed: int = 0
+    requests_granted: int = 0
 
 
 class RateLimitService:
@@ -71,14 +105,19 @@ class RateLimitService:
             return settings.rate_limit_mobile_per_day
 
     async def check_rate_limit(
-        self, app_store: AppStore, pro_token: str
+        self, app_store: AppStore, pro_token: str, count: int = 1
     ) -> RateLimitResult:
         """
-        Check if request is within rate limits.
+        Check if a request (or a batch of count requests) is within limits.
+
+        For batches, as much of the batch as fits in the remaining quota is
+        debited atomically; requests_granted reports how many were allowed,
+        which may be fewer than count.
 
         Args:
             app_store: App store making the request
             pro_token: Purchase token
+            count: Number of requests to debit (batch size)
 
         Returns:
             RateLimitResult with limit status
@@ -89,8 +128,38 @@ class RateLimitService:
                 is_rate_limited=False,
                 requests_made=0,
                 requests_allowed=999999,
+                requests_granted=count,
             )
 
+        key = (app_store.value, pro_token)
+
+        # Serialize checks per bucket so concurrent requests for the same
+        # token don't each hold a DB connection for the check-then-insert
+        lock = await _get_bucket_lock(key)
+        async with lock:
+            # Reuse a recent non-limited decision and skip the DB round trip
+            # (single requests only: batches must debit their real size)
+            if count == 1:
+                cached = _recently_allowed.get(key)
+                if cached is not None:
+                    cached_at, cached_result = cached
+                    if time.monotonic() - cached_at < _ALLOWED_CACHE_TTL_SECONDS:
+                        return cached_result
+                    del _recently_allowed[key]
+
+            result = await self._check_rate_limit(app_store, pro_token, count)
+
+            if not result.is_rate_limited and count == 1:
+                if len(_recently_allowed) >= _MAX_ENTRIES:
+                    _recently_allowed.clear()
+                _recently_allowed[key] = (time.monotonic(), result)
+
+            return result
+
+    async def _check_rate_limit(
+        self, app_store: AppStore, pro_token: str, count: int = 1
+    ) -> RateLimitResult:
+        """Run the rate limit check against the database."""
         hashed_token = self._hash_token(pro_token)
         limit = self._get_limit_for_app_store(app_store)
 
@@ -98,21 +167,21 @@ class RateLimitService:
         twenty_four_hours_ago = datetime.utcnow() - timedelta(days=1)
 
         result = await self.db.execute(
-            select(func.count(RateLimitConsumption.id))
+            select(func.count(col(RateLimitConsumption.id)))
             .where(RateLimitConsumption.hashed_token == hashed_token)
             .where(RateLimitConsumption.app_store == app_store.value)
             .where(RateLimitConsumption.timestamp >= twenty_four_hours_ago)
         )
-        count = result.scalar() or 0
+        consumed = result.scalar() or 0
 
-        if count >= limit:
+        if consumed >= limit:
             # Find oldest request to calculate retry_after
             oldest_result = await self.db.execute(
                 select(RateLimitConsumption.timestamp)
                 .where(RateLimitConsumption.hashed_token == hashed_token)
                 .where(RateLimitConsumption.app_store == app_store.value)
                 .where(RateLimitConsumption.timestamp >= twenty_four_hours_ago)
-                .order_by(RateLimitConsumption.timestamp.asc())
+                .order_by(col(RateLimitConsumption.timestamp).asc())
                 .limit(1)
             )
             oldest_timestamp = oldest_result.scalar()
@@ -127,32 +196,43 @@ class RateLimitService:
             return RateLimitResult(
                 is_rate_limited=True,
                 retry_after=retry_after,
-                requests_made=count,
+                requests_made=consumed,
                 requests_allowed=limit,
             )
 
-        # Record this request
-        consumption = RateLimitConsumption(
-            hashed_token=hashed_token,
-            app_store=app_store.value,
-            timestamp=datetime.utcnow(),
+        # Record as much of the batch as fits in the remaining quota with a
+        # single Core multi-row INSERT - no per-row ORM objects or unit-of-
+        # work bookkeeping on the highest-QPS write path. timestamp comes
+        # from the database's server default, so every row in the batch
+        # gets the transaction clock without a bind parameter.
+        granted = min(count, limit - consumed)
+        await self.db.execute(
+            insert(RateLimitConsumption),
+            [
+                {"hashed_token": hashed_token, "app_store": app_store.value}
+                for _ in range(granted)
+            ],
         )
-        self.db.add(consumption)
         await self.db.commit()
 
         return RateLimitResult(
             is_rate_limited=False,
-            requests_made=count + 1,
+            requests_made=consumed + granted,
             requests_allowed=limit,
+            requests_granted=granted,
         )
 
 
 async def get_rate_limit_service(
-    db: AsyncSession,
+    db: Annotated[AsyncSession, Depends(get_rate_limit_db)],
 ) -> RateLimitService:
     """
     Dependency injection for rate limit service.
 
+    Resolves the rate limit database session itself, so routes can inject the
+    service directly and FastAPI's per-request dependency cache reuses both
+    the session and the service within a request.
+
     Args:
         db: Rate limit database session
 
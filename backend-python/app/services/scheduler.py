@@ -6,7 +6,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
-from app.db.session import UserDataSessionLocal
+from app.db.session import RateLimitSessionLocal, UserDataSessionLocal
 from app.services.cleanup import CleanupService
 
 logger = logging.getLogger(__name__)
@@ -24,8 +24,8 @@ class BackgroundScheduler:
         """Background task for cleaning up expired data."""
         logger.info("Running scheduled cleanup task")
 
-        async with UserDataSessionLocal() as db:
-            cleanup_service = CleanupService(db)
+        async with UserDataSessionLocal() as db, RateLimitSessionLocal() as rate_limit_db:
+            cleanup_service = CleanupService(db, rate_limit_db)
             try:
                 stats = await cleanup_service.cleanup_all()
                 logger.info(f"Cleanup stats: {stats}")
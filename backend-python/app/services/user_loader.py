@@ -0,0 +1,136 @@
+"""Coalescing loader for User point lookups."""
+
+import asyncio
+import time
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.database.user import User
+
+# How long a lookup waits for companions before flushing, and the batch
+# size that flushes immediately. The window is small enough to be invisible
+# per-request but wide enough to catch the bursts feed refreshes produce.
+_MAX_WAIT_SECONDS = 0.002
+_MAX_BATCH_SIZE = 100
+
+# Snapshots are reused briefly so a client hammering a write endpoint skips
+# the auth SELECT entirely on repeat calls. The reuse window comes from
+# settings.auth_snapshot_ttl_seconds and is disabled by default: mutating
+# routes invalidate explicitly, but only within their own process, so on a
+# multi-worker deployment a deleted or re-keyed account can keep
+# authenticating on the other workers until the TTL lapses.
+_SNAPSHOT_MAX_ENTRIES = 10_000
+
+
+class UserLoader:
+    """
+    Batch concurrent User-by-id lookups into one ``WHERE id IN (...)`` query.
+
+    Nearly every authenticated endpoint starts with the same point SELECT on
+    users; under bursty traffic those arrive together and flood the database
+    with tiny queries. Lookups registered within a short window are collected
+    and answered from a single round trip on a session bound to the same
+    engine as the callers' request-scoped sessions, so dependency overrides
+    (such as the test suite pointing get_db at another database) carry
+    through to the batched query.
+
+    Returned instances are detached (the loader session closes after the
+    flush) and may be shared between concurrent requests, so callers must
+    treat them as read-only snapshots.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, list[asyncio.Future[User | None]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_bind: AsyncEngine | None = None
+        self._snapshots: dict[UUID, tuple[float, User | None]] = {}
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop any cached snapshot for a user after a mutation."""
+        self._snapshots.pop(user_id, None)
+
+    async def load(self, user_id: UUID, db: AsyncSession) -> User | None:
+        """
+        Look up a user by id, coalescing with concurrent lookups.
+
+        When the snapshot cache is enabled (auth_snapshot_ttl_seconds > 0),
+        a snapshot cached within the TTL resolves without touching the
+        database at all, which removes the auth round trip for clients
+        making bursts of writes.
+
+        Args:
+            user_id: User UUID to fetch
+            db: The caller's request-scoped session; the batched query runs
+                against its engine (callers awaiting a flush keep their
+                session open, so the bind is always live)
+
+        Returns:
+            The User, or None if no such row exists
+        """
+        ttl = settings.auth_snapshot_ttl_seconds
+        if ttl > 0:
+            cached = self._snapshots.get(user_id)
+            if cached is not None:
+                cached_at, user = cached
+                if time.monotonic() - cached_at < ttl:
+                    return user
+                del self._snapshots[user_id]
+
+        future: asyncio.Future[User | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending.setdefault(user_id, []).append(future)
+        bind = db.bind
+        assert isinstance(bind, AsyncEngine)
+        self._flush_bind = bind
+
+        if len(self._pending) >= _MAX_BATCH_SIZE:
+            await self._flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_wait())
+
+        return await future
+
+    async def _flush_after_wait(self) -> None:
+        await asyncio.sleep(_MAX_WAIT_SECONDS)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        bind = self._flush_bind
+        assert bind is not None
+
+        try:
+            async with AsyncSession(bind, expire_on_commit=False) as session:
+                result = await session.execute(
+                    select(User).where(col(User.id).in_(list(pending)))
+                )
+                users = {user.id: user for user in result.scalars()}
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        cache_snapshots = settings.auth_snapshot_ttl_seconds > 0
+        if cache_snapshots and len(self._snapshots) >= _SNAPSHOT_MAX_ENTRIES:
+            self._snapshots.clear()
+        now = time.monotonic()
+        for user_id, futures in pending.items():
+            user = users.get(user_id)
+            if cache_snapshots:
+                self._snapshots[user_id] = (now, user)
+            for future in futures:
+                if not future.done():
+                    future.set_result(user)
+
+
+user_loader = UserLoader()
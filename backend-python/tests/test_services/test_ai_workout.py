@@ -2,7 +2,10 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from app.services.ai_workout_planner.gpt_planner import GptAiWorkoutPlanner
+from app.services.ai_workout_planner.gpt_planner import (
+    GptAiWorkoutPlanner,
+    _scan_complete_sessions,
+)
 from app.services.ai_workout_planner.gpt_chat_planner import GptChatWorkoutPlanner
 from app.models.schemas.ai_workout import AiWorkoutAttributes, AiSessionAttributes
 from app.core.enums import ExperienceLevel
@@ -67,6 +70,27 @@ async def test_build_session_prompt():
     assert "Dumbbells, resistance bands" in prompt
 
 
+def test_scan_complete_sessions_partial_payload():
+    """Test that only fully-emitted session objects are extracted."""
+    session_a = '{"name": "Push {day}", "exercises": [{"name": "Bench \\"pause\\"", "sets": 3}]}'
+    session_b = '{"name": "Pull]", "exercises": []}'
+
+    # Only session A has closed; session B is mid-stream
+    buffer = '{"name": "Program", "sessions": [' + session_a + ", " + session_b[:12]
+    assert _scan_complete_sessions(buffer) == [session_a]
+
+    # Both sessions complete once the payload finishes
+    buffer = '{"name": "Program", "sessions": [' + session_a + ", " + session_b + "]}"
+    assert _scan_complete_sessions(buffer) == [session_a, session_b]
+
+
+def test_scan_complete_sessions_no_sessions_yet():
+    """Test scanning before the sessions array has started streaming."""
+    assert _scan_complete_sessions("") == []
+    assert _scan_complete_sessions('{"name": "Program"') == []
+    assert _scan_complete_sessions('{"name": "Program", "sessions"') == []
+
+
 @pytest.mark.asyncio
 async def test_chat_planner_initialization():
     """Test chat workout planner initialization."""
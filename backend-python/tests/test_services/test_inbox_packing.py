@@ -0,0 +1,50 @@
+"""Tests for inbox message chunk packing."""
+
+import os
+import struct
+
+from app.models.database.user_inbox_item import (
+    pack_message_chunks,
+    unpack_message_chunks,
+)
+
+
+def test_pack_unpack_round_trip_multi_chunk():
+    """Typical RSA-chunked messages survive the round trip unchanged."""
+    chunks = [os.urandom(256) for _ in range(5)]
+
+    packed = pack_message_chunks(chunks)
+    assert unpack_message_chunks(packed, len(chunks)) == chunks
+
+
+def test_pack_unpack_round_trip_empty_list():
+    """A message with no chunks packs to an empty blob and back."""
+    packed = pack_message_chunks([])
+
+    assert packed == b""
+    assert unpack_message_chunks(packed, 0) == []
+
+
+def test_pack_unpack_round_trip_empty_chunk():
+    """Zero-length chunks keep their position through the round trip."""
+    chunks = [b"", os.urandom(256), b""]
+
+    packed = pack_message_chunks(chunks)
+    assert unpack_message_chunks(packed, len(chunks)) == chunks
+
+
+def test_pack_unpack_round_trip_ragged_chunks():
+    """Chunk sizes are not assumed fixed; ragged sizes round-trip too."""
+    chunks = [b"a", os.urandom(512), os.urandom(17)]
+
+    packed = pack_message_chunks(chunks)
+    assert unpack_message_chunks(packed, len(chunks)) == chunks
+
+
+def test_pack_frames_with_big_endian_length_prefix():
+    """The framing matches int4send() used by the data migration."""
+    chunk = b"payload"
+
+    packed = pack_message_chunks([chunk])
+
+    assert packed == struct.pack(">I", len(chunk)) + chunk
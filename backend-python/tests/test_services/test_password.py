@@ -63,3 +63,66 @@ def test_same_password_different_salt():
     # But both should verify correctly
     assert service.verify_password(password, hex_hash1, salt1)
     assert service.verify_password(password, hex_hash2, salt2)
+
+
+async def test_verify_user_password_caches_result():
+    """Test that repeated verification reuses the cached KDF result."""
+    from types import SimpleNamespace
+    from app.auth import password as auth_password
+
+    service = PasswordService()
+    password = "test_password_123"
+    hex_hash, salt = service.hash_password(password)
+    user = SimpleNamespace(hashed_password=hex_hash, salt=salt)
+
+    kdf_calls = 0
+    original_verify = service.verify_password
+
+    def counting_verify(*args, **kwargs):
+        nonlocal kdf_calls
+        kdf_calls += 1
+        return original_verify(*args, **kwargs)
+
+    service.verify_password = counting_verify  # type: ignore[method-assign]
+    auth_password._verification_cache.clear()
+    try:
+        await auth_password.verify_user_password(password, user, service)
+        await auth_password.verify_user_password(password, user, service)
+    finally:
+        auth_password._verification_cache.clear()
+
+    # Second call is served from the cache without re-running the KDF
+    assert kdf_calls == 1
+
+
+async def test_verify_user_password_deduplicates_concurrent_misses():
+    """Test that concurrent cache misses for the same key share one KDF run."""
+    import asyncio
+    from types import SimpleNamespace
+    from app.auth import password as auth_password
+
+    service = PasswordService()
+    password = "test_password_123"
+    hex_hash, salt = service.hash_password(password)
+    user = SimpleNamespace(hashed_password=hex_hash, salt=salt)
+
+    kdf_calls = 0
+    original_verify = service.verify_password
+
+    def counting_verify(*args, **kwargs):
+        nonlocal kdf_calls
+        kdf_calls += 1
+        return original_verify(*args, **kwargs)
+
+    service.verify_password = counting_verify  # type: ignore[method-assign]
+    auth_password._verification_cache.clear()
+    try:
+        await asyncio.gather(
+            auth_password.verify_user_password(password, user, service),
+            auth_password.verify_user_password(password, user, service),
+            auth_password.verify_user_password(password, user, service),
+        )
+    finally:
+        auth_password._verification_cache.clear()
+
+    assert kdf_calls == 1